@@ -6,8 +6,8 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
 
 from src.api.dependencies.session import get_async_session
-from src.config.manager import settings
-from src.models.db.account import Account, UserRole
+from src.config.manager import JWT_SECRET_KEY
+from src.models.db.account import Account
 from src.repository.crud.account import AccountCRUDRepository
 from src.securities.authorizations.jwt import jwt_generator
 
@@ -15,6 +15,16 @@ from src.securities.authorizations.jwt import jwt_generator
 security = HTTPBearer()
 
 
+# Loads the account a decoded token refers to: by primary key when the token carries the
+# `user_id` claim, by username for tokens issued before that claim existed
+async def _read_token_account(
+    account_repo: AccountCRUDRepository, user_id: int | None, username: str
+) -> Account | None:
+    if user_id is not None:
+        return await account_repo.read_account_by_id(id=user_id)
+    return await account_repo.read_account_by_username(username=username)
+
+
 # Dependency: extracts and validates the JWT token, then loads the corresponding Account
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -25,10 +35,10 @@ async def get_current_user(
     """
     token = credentials.credentials
 
-    # Decode the JWT to extract the username and email claims
+    # Decode the JWT to extract the account ID and username claims
     try:
-        username, email = jwt_generator.retrieve_details_from_token(
-            token=token, secret_key=settings.JWT_SECRET_KEY
+        user_id, username = jwt_generator.retrieve_identity_from_token(
+            token=token, secret_key=JWT_SECRET_KEY
         )
     except ValueError as e:
         raise HTTPException(
@@ -37,11 +47,11 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Look up the account in the database by the username embedded in the token
+    # Look up the account in the database by the identity embedded in the token
     account_repo = AccountCRUDRepository(async_session=async_session)
 
     try:
-        account = await account_repo.read_account_by_username(username=username)
+        account = await _read_token_account(account_repo=account_repo, user_id=user_id, username=username)
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -73,7 +83,7 @@ async def require_admin(
     """
     Dependency to ensure the current user is an admin.
     """
-    if current_user.role != UserRole.ADMIN.value:
+    if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required",
@@ -100,8 +110,8 @@ async def get_optional_current_user(
 
     # Silently return None on invalid/expired tokens instead of raising
     try:
-        username, email = jwt_generator.retrieve_details_from_token(
-            token=token, secret_key=settings.JWT_SECRET_KEY
+        user_id, username = jwt_generator.retrieve_identity_from_token(
+            token=token, secret_key=JWT_SECRET_KEY
         )
     except ValueError:
         return None
@@ -110,7 +120,7 @@ async def get_optional_current_user(
 
     # Return the account only if it exists and is not blocked
     try:
-        account = await account_repo.read_account_by_username(username=username)
+        account = await _read_token_account(account_repo=account_repo, user_id=user_id, username=username)
         if account and not account.is_blocked:
             return account
     except Exception:
@@ -18,7 +18,6 @@ from src.repository.crud.otp import OTPCRUDRepository
 from src.securities.authorizations.jwt import jwt_generator
 from src.services.otp_service import otp_service, email_service as mock_email_service
 from src.services.email_service import email_service as smtp_email_service
-from src.utilities.exceptions.database import EntityAlreadyExists
 from src.utilities.exceptions.http.exc_400 import (
     http_exc_400_credentials_bad_signin_request,
     http_exc_400_credentials_bad_signup_request,
@@ -89,18 +88,14 @@ async def signup(
         )
 
     # Step 3: Check username uniqueness before creating the account
-    try:
-        await account_repo.is_username_taken(username=account_create.username)
-    except EntityAlreadyExists:
+    if await account_repo.is_username_taken(username=account_create.username):
         raise fastapi.HTTPException(
             status_code=fastapi.status.HTTP_400_BAD_REQUEST,
             detail=f"Username '{account_create.username}' is already taken",
         )
 
     # Step 4: Check email uniqueness before creating the account
-    try:
-        await account_repo.is_email_taken(email=account_create.email)
-    except EntityAlreadyExists:
+    if await account_repo.is_email_taken(email=account_create.email):
         raise fastapi.HTTPException(
             status_code=fastapi.status.HTTP_400_BAD_REQUEST,
             detail=f"Email '{account_create.email}' is already registered",
@@ -177,11 +172,8 @@ async def send_email_otp(
     code = otp_service.generate_otp()
     expires_at = otp_service.get_expiry_time()
 
-    # Invalidate any existing unused OTPs for this email to prevent confusion
-    await otp_repo.invalidate_previous_otps(purpose="email_login", email=request.email)
-
-    # Store the new OTP in the database
-    await otp_repo.create_otp(
+    # Store the new OTP, invalidating any existing unused OTPs for this email in the same statement
+    await otp_repo.rotate_otp(
         code=code,
         purpose="email_login",
         expires_at=expires_at,
@@ -315,8 +307,7 @@ async def forgot_password(
     code = otp_service.generate_otp()
     expires_at = otp_service.get_expiry_time()
 
-    await otp_repo.invalidate_previous_otps(purpose="reset_password", email=request.email)
-    await otp_repo.create_otp(
+    await otp_repo.rotate_otp(
         code=code,
         purpose="reset_password",
         expires_at=expires_at,
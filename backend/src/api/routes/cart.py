@@ -32,7 +32,7 @@ def _build_cart_response(cart) -> CartResponse:
 
     # Iterate over each cart item, compute per-item subtotals, and accumulate the cart subtotal
     for item in cart.items:
-        item_subtotal = Decimal(str(item.unit_price)) * item.quantity
+        item_subtotal = item.subtotal
         subtotal += item_subtotal
         items.append(CartItemResponse(
             id=item.id,
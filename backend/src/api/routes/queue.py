@@ -16,6 +16,7 @@ from src.repository.crud.queue import QueueCRUDRepository
 from src.repository.crud.event import EventCRUDRepository
 from src.services.queue_service import queue_service
 from src.utilities.exceptions.database import EntityDoesNotExist
+from src.workers.queue_processor import queue_processor
 
 router = fastapi.APIRouter(prefix="/queue", tags=["queue"])
 
@@ -53,6 +54,10 @@ async def join_queue(
             user_agent=user_agent,
         )
 
+        # Push the new queue length to everyone watching this event through this worker;
+        # other workers pick it up on their next periodic sweep
+        queue_processor.notify_queue_changed(event_id=event_id)
+
         return QueueJoinResponse(**result)
 
     except EntityDoesNotExist:
@@ -77,14 +82,12 @@ async def get_position(
     event_id: int,
     current_user: Account = Depends(get_current_user),
     queue_repo: QueueCRUDRepository = Depends(get_repository(repo_type=QueueCRUDRepository)),
-    event_repo: EventCRUDRepository = Depends(get_repository(repo_type=EventCRUDRepository)),
 ) -> QueuePositionResponse:
     """Get the current user's position in the queue."""
     try:
         # Fetch the user's queue entry and compute their live position
         result = await queue_service.get_position(
             queue_repo=queue_repo,
-            event_repo=event_repo,
             event_id=event_id,
             user_id=current_user.id,
         )
@@ -121,6 +124,9 @@ async def leave_queue(
     )
 
     if success:
+        # Everyone behind the leaving user moves up; push their new positions (this worker's
+        # viewers now, other workers' on their next sweep)
+        queue_processor.notify_queue_changed(event_id=event_id)
         return QueueLeaveResponse(success=True, message="Successfully left the queue")
     else:
         # User was not in the queue, so there is nothing to remove
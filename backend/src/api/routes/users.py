@@ -1,7 +1,8 @@
 # User profile routes: view/update profile, phone verification, and email verification
 # All endpoints require authentication (get_current_user dependency)
 import fastapi
-from fastapi import Depends
+from fastapi import BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
 
 from src.api.dependencies.auth import get_current_user
 from src.api.dependencies.repository import get_repository
@@ -11,11 +12,33 @@ from src.models.schemas.otp import OTPSendRequest, OTPSendResponse, OTPVerifyReq
 from src.repository.crud.account import AccountCRUDRepository
 from src.repository.crud.otp import OTPCRUDRepository
 from src.services.otp_service import otp_service, sms_service, email_service
+from src.utilities.exceptions.database import EntityAlreadyExists, EntityDoesNotExist
 
 # All user-related routes are grouped under the /users prefix
 router = fastapi.APIRouter(prefix="/users", tags=["users"])
 
 
+# Builds the profile response from an Account. The AccountProfile is validated once here and
+# returned as a ready ORJSONResponse, so FastAPI skips its second response_model validation pass
+# (response_model is kept on the routes for the OpenAPI schema only).
+def _build_profile_response(account: Account) -> ORJSONResponse:
+    profile = AccountProfile(
+        id=account.id,
+        username=account.username,
+        email=account.email,
+        role=account.role,
+        phone=account.phone,
+        full_name=account.full_name,
+        is_verified=account.is_verified,
+        is_active=account.is_active,
+        is_phone_verified=account.is_phone_verified,
+        created_at=account.created_at,
+        updated_at=account.updated_at,
+    )
+    # by_alias keeps the camelCase keys FastAPI would have produced
+    return ORJSONResponse(content=profile.model_dump(by_alias=True))
+
+
 # GET /users/me - Retrieve the authenticated user's profile information
 @router.get(
     "/me",
@@ -25,22 +48,9 @@ router = fastapi.APIRouter(prefix="/users", tags=["users"])
 )
 async def get_current_user_profile(
     current_user: Account = Depends(get_current_user),
-) -> AccountProfile:
+) -> ORJSONResponse:
     """Get current user's profile"""
-    # Map the database Account model to the AccountProfile response schema
-    return AccountProfile(
-        id=current_user.id,
-        username=current_user.username,
-        email=current_user.email,
-        role=current_user.role,
-        phone=current_user.phone,
-        full_name=current_user.full_name,
-        is_verified=current_user.is_verified,
-        is_active=current_user.is_active,
-        is_phone_verified=current_user.is_phone_verified,
-        created_at=current_user.created_at,
-        updated_at=current_user.updated_at,
-    )
+    return _build_profile_response(current_user)
 
 
 # PATCH /users/me - Partially update the authenticated user's profile fields
@@ -54,47 +64,26 @@ async def update_current_user_profile(
     profile_update: AccountProfileUpdate,
     current_user: Account = Depends(get_current_user),
     account_repo: AccountCRUDRepository = Depends(get_repository(repo_type=AccountCRUDRepository)),
-) -> AccountProfile:
+) -> ORJSONResponse:
     """Update current user's profile"""
-    # If the username is being changed, verify the new one is not already taken
-    if profile_update.username and profile_update.username != current_user.username:
-        try:
-            await account_repo.is_username_taken(username=profile_update.username)
-        except Exception:
-            raise fastapi.HTTPException(
-                status_code=fastapi.status.HTTP_400_BAD_REQUEST,
-                detail="Username is already taken",
-            )
-
-    # If the email is being changed, verify the new one is not already registered
-    if profile_update.email and profile_update.email != current_user.email:
-        try:
-            await account_repo.is_email_taken(email=profile_update.email)
-        except Exception:
-            raise fastapi.HTTPException(
-                status_code=fastapi.status.HTTP_400_BAD_REQUEST,
-                detail="Email is already registered",
-            )
-
-    # Apply the partial update and return the refreshed profile
-    updated_account = await account_repo.update_profile(
-        account_id=current_user.id,
-        profile_update=profile_update,
-    )
+    # Apply the partial update; uniqueness of a new username/email is checked in the same statement
+    try:
+        updated_account = await account_repo.update_profile_checked(
+            account_id=current_user.id,
+            profile_update=profile_update,
+        )
+    except EntityAlreadyExists as e:
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except EntityDoesNotExist as e:
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
 
-    return AccountProfile(
-        id=updated_account.id,
-        username=updated_account.username,
-        email=updated_account.email,
-        role=updated_account.role,
-        phone=updated_account.phone,
-        full_name=updated_account.full_name,
-        is_verified=updated_account.is_verified,
-        is_active=updated_account.is_active,
-        is_phone_verified=updated_account.is_phone_verified,
-        created_at=updated_account.created_at,
-        updated_at=updated_account.updated_at,
-    )
+    return _build_profile_response(updated_account)
 
 
 # ==================== Phone Verification ====================
@@ -109,6 +98,7 @@ async def update_current_user_profile(
     status_code=fastapi.status.HTTP_200_OK,
 )
 async def send_phone_verification(
+    background_tasks: BackgroundTasks,
     current_user: Account = Depends(get_current_user),
     otp_repo: OTPCRUDRepository = Depends(get_repository(repo_type=OTPCRUDRepository)),
 ) -> OTPSendResponse:
@@ -131,8 +121,7 @@ async def send_phone_verification(
     code = otp_service.generate_otp()
     expires_at = otp_service.get_expiry_time()
 
-    await otp_repo.invalidate_previous_otps(purpose="verify_phone", phone=current_user.phone)
-    await otp_repo.create_otp(
+    await otp_repo.rotate_otp(
         code=code,
         purpose="verify_phone",
         expires_at=expires_at,
@@ -140,8 +129,8 @@ async def send_phone_verification(
         phone=current_user.phone,
     )
 
-    # Deliver the OTP via SMS
-    await sms_service.send_otp(phone=current_user.phone, code=code)
+    # Deliver the OTP via SMS after the response is sent, keeping provider latency off the request
+    background_tasks.add_task(sms_service.send_otp, phone=current_user.phone, code=code)
 
     return OTPSendResponse(
         message="Verification OTP sent to your phone",
@@ -202,6 +191,7 @@ async def confirm_phone_verification(
     status_code=fastapi.status.HTTP_200_OK,
 )
 async def send_email_verification(
+    background_tasks: BackgroundTasks,
     current_user: Account = Depends(get_current_user),
     otp_repo: OTPCRUDRepository = Depends(get_repository(repo_type=OTPCRUDRepository)),
 ) -> OTPSendResponse:
@@ -217,8 +207,7 @@ async def send_email_verification(
     code = otp_service.generate_otp()
     expires_at = otp_service.get_expiry_time()
 
-    await otp_repo.invalidate_previous_otps(purpose="verify_email", email=current_user.email)
-    await otp_repo.create_otp(
+    await otp_repo.rotate_otp(
         code=code,
         purpose="verify_email",
         expires_at=expires_at,
@@ -226,8 +215,8 @@ async def send_email_verification(
         email=current_user.email,
     )
 
-    # Deliver the OTP via email
-    await email_service.send_otp(email=current_user.email, code=code)
+    # Deliver the OTP via email after the response is sent, keeping provider latency off the request
+    background_tasks.add_task(email_service.send_otp, email=current_user.email, code=code)
 
     return OTPSendResponse(
         message="Verification OTP sent to your email",
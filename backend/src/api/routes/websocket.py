@@ -1,18 +1,19 @@
 # WebSocket route for real-time queue position updates.
 # Provides a persistent connection so the frontend can display live queue movement
 # without polling the REST API.
+import asyncio
+
 import fastapi
 from fastapi import WebSocket, WebSocketDisconnect, Query
 from loguru import logger
 
-from src.config.manager import settings
+from src.config.manager import JWT_SECRET_KEY
 from src.repository.crud.account import AccountCRUDRepository
-from src.repository.crud.queue import QueueCRUDRepository
-from src.repository.crud.event import EventCRUDRepository
-from src.repository.events import async_db_session
+from src.repository.database import AsyncDatabase
 from src.services.websocket_manager import queue_connection_manager
-from src.services.queue_service import queue_service
+from src.services.queue_position_batcher import queue_position_batcher
 from src.securities.authorizations.jwt import jwt_generator
+from src.securities.authorizations.token_cache import jwt_user_cache
 
 router = fastapi.APIRouter(tags=["websocket"])
 
@@ -20,26 +21,69 @@ router = fastapi.APIRouter(tags=["websocket"])
 # Extracts and validates a JWT token to identify the connecting user.
 # WebSockets cannot use standard HTTP auth headers easily, so the token
 # is passed as a query parameter instead.
-async def get_user_id_from_token(token: str) -> int | None:
+# The account lookup borrows a session from the application's database (the same pool
+# HTTP routes use) and only after the cache missed and the token decoded cleanly.
+async def get_user_id_from_token(token: str, database: AsyncDatabase) -> int | None:
     """Validate JWT token and return user ID."""
+    # Warm tokens resolve from the cache without touching the database
+    cached = jwt_user_cache.get(token=token)
+    if cached is not None:
+        user_id, is_blocked = cached
+        return None if is_blocked else user_id
+
     try:
-        # Decode the JWT to extract the username and email claims
-        username, email = jwt_generator.retrieve_details_from_token(
-            token=token, secret_key=settings.JWT_SECRET_KEY
-        )
-        # Look up the account in the database to get the numeric user ID
-        async with async_db_session() as session:
+        # Decode the JWT; invalid or expired tokens are rejected before any DB access
+        claims = jwt_generator.retrieve_claims_from_token(token=token, secret_key=JWT_SECRET_KEY)
+        user_id = claims.get("user_id")
+
+        async with database.async_session_factory() as session:
             account_repo = AccountCRUDRepository(async_session=session)
-            account = await account_repo.read_account_by_username(username=username)
-            # Reject blocked accounts even if the token is valid
-            if account and not account.is_blocked:
-                return account.id
-        return None
+            if user_id is not None:
+                # The token names the account directly: only its blocked flag is needed
+                is_blocked = await account_repo.read_account_block_status(account_id=user_id)
+            else:
+                # Tokens issued before the user_id claim: resolve the account by username
+                account = await account_repo.read_account_by_username(username=claims["username"])
+                user_id, is_blocked = (account.id, account.is_blocked) if account else (None, None)
+
+        if is_blocked is None:
+            return None
+
+        # Remember the resolution for the rest of the token's lifetime
+        jwt_user_cache.set(token=token, user_id=user_id, is_blocked=is_blocked, exp=claims["exp"])
+        # Reject blocked accounts even if the token is valid
+        if is_blocked:
+            return None
+        return user_id
     except Exception as e:
         logger.error(f"Token validation failed: {e}")
         return None
 
 
+# Fetches the user's queue position and pushes it over their WebSocket.
+# Lookups are coalesced with concurrent ones for the same event into a single query, and the
+# pooled connection is returned before anything is sent, so slow clients never pin it.
+async def _fetch_and_push(event_id: int, user_id: int) -> bool:
+    """Fetch the current queue position and send it to the user. Returns False if not in queue."""
+    position_data = await queue_position_batcher.get(event_id=event_id, user_id=user_id)
+
+    if not position_data:
+        return False
+
+    # Push the position update to this specific user's WebSocket
+    await queue_connection_manager.send_position_update(
+        event_id=event_id,
+        user_id=user_id,
+        position=position_data["position"],
+        status=position_data["status"],
+        estimated_wait=position_data.get("estimated_wait_minutes"),
+        total_ahead=position_data["total_ahead"],
+        expires_at=position_data.get("expires_at"),
+        can_proceed=position_data.get("can_proceed", False),
+    )
+    return True
+
+
 # --- WS /ws/queue/{event_id}?token=<jwt> ---
 # Establishes a WebSocket connection for a user to receive real-time queue position updates.
 # Flow:
@@ -56,120 +100,71 @@ async def queue_websocket(
     token: str = Query(...),
 ):
     """WebSocket endpoint for real-time queue position updates."""
-    # Must accept before sending any data or closing with a custom code
-    await websocket.accept()
+    # Must accept before sending any data or closing with a custom code.
+    # Clients offering the "msgpack" subprotocol get binary msgpack frames, others JSON text.
+    await websocket.accept(subprotocol=queue_connection_manager.negotiate_codec(websocket))
 
     # Authenticate the user via the JWT token query parameter
-    user_id = await get_user_id_from_token(token)
+    user_id = await get_user_id_from_token(token=token, database=websocket.app.state.db)
     if not user_id:
         # Send an error message before closing so the client knows why
-        await websocket.send_json({"type": "error", "data": {"message": "Invalid token"}})
+        await queue_connection_manager.send_message(websocket, {"type": "error", "data": {"message": "Invalid token"}})
         await websocket.close(code=4001, reason="Invalid token")
+        queue_connection_manager.release_codec(websocket)
         return
 
     # Register this WebSocket in the connection manager, keyed by event_id and user_id.
-    # If the same user reconnects, close their previous connection to avoid duplicates.
-    async with queue_connection_manager._lock:
-        if event_id not in queue_connection_manager.active_connections:
-            queue_connection_manager.active_connections[event_id] = {}
-
-        # Close any existing connection for the same user on this event
-        if user_id in queue_connection_manager.active_connections[event_id]:
-            try:
-                await queue_connection_manager.active_connections[event_id][user_id].close()
-            except Exception:
-                pass
+    # If the same user reconnects, their previous connection is closed to avoid duplicates.
+    await queue_connection_manager.register(websocket, event_id, user_id)
 
-        queue_connection_manager.active_connections[event_id][user_id] = websocket
-
-    logger.info(f"WebSocket connected: user {user_id} for event {event_id}")
+    # Allows at most one in-flight position fetch per connection so a flood of
+    # "refresh" messages cannot check out more than one pooled DB connection
+    fetch_slot = asyncio.Semaphore(1)
 
     try:
         # Send the user's current queue position immediately upon connection
         try:
-            async with async_db_session() as session:
-                queue_repo = QueueCRUDRepository(async_session=session)
-                event_repo = EventCRUDRepository(async_session=session)
-
-                # Fetch the user's live position data from the queue service
-                position_data = await queue_service.get_position(
-                    queue_repo=queue_repo,
-                    event_repo=event_repo,
-                    event_id=event_id,
-                    user_id=user_id,
-                )
-
-                if position_data:
-                    # Convert the expires_at datetime to ISO string for JSON serialization
-                    expires_at_str = None
-                    if position_data.get("expires_at"):
-                        expires_at_str = position_data["expires_at"].isoformat()
-
-                    # Push the position update to this specific user's WebSocket
-                    await queue_connection_manager.send_position_update(
-                        event_id=event_id,
-                        user_id=user_id,
-                        position=position_data["position"],
-                        status=position_data["status"],
-                        estimated_wait=position_data.get("estimated_wait_minutes"),
-                        total_ahead=position_data["total_ahead"],
-                        expires_at=expires_at_str,
-                        can_proceed=position_data.get("can_proceed", False),
-                    )
-                else:
-                    # User connected but is not in the queue for this event
-                    logger.warning(f"User {user_id} not in queue for event {event_id}")
+            async with fetch_slot:
+                in_queue = await _fetch_and_push(event_id=event_id, user_id=user_id)
+            if not in_queue:
+                # User connected but is not in the queue for this event
+                logger.warning(f"User {user_id} not in queue for event {event_id}")
         except Exception as e:
             logger.error(f"Error fetching initial position: {e}")
-            await websocket.send_json({"type": "error", "data": {"message": "Failed to fetch queue position"}})
+            await queue_connection_manager.send_message(
+                websocket, {"type": "error", "data": {"message": "Failed to fetch queue position"}}
+            )
 
         # Main message loop: keep the connection alive and handle client-initiated messages
         while True:
-            # Block until the client sends a JSON message
-            data = await websocket.receive_json()
+            # Block until the client sends a message (JSON or msgpack, per negotiated codec)
+            data = await queue_connection_manager.receive_message(websocket)
 
             # Handle "refresh" messages: the client requests an updated position
             if data.get("type") == "refresh":
-                async with async_db_session() as session:
-                    queue_repo = QueueCRUDRepository(async_session=session)
-                    event_repo = EventCRUDRepository(async_session=session)
-
-                    # Re-fetch the latest position data
-                    position_data = await queue_service.get_position(
-                        queue_repo=queue_repo,
-                        event_repo=event_repo,
-                        event_id=event_id,
-                        user_id=user_id,
+                # Refreshes arriving within the minimum interval are dropped outright: the
+                # position pushed moments ago is still current, and spam costs nothing
+                if not queue_connection_manager.allow_refresh(event_id=event_id, user_id=user_id):
+                    continue
+
+                # The queue processor pushes fresh positions whenever the queue changes, so the
+                # last pushed snapshot is current; only fall back to the DB when none is held
+                if await queue_connection_manager.resend_last_position(event_id=event_id, user_id=user_id):
+                    continue
+
+                async with fetch_slot:
+                    in_queue = await _fetch_and_push(event_id=event_id, user_id=user_id)
+                if not in_queue:
+                    # User left the queue or was removed while connected
+                    await queue_connection_manager.send_message(
+                        websocket, {"type": "error", "data": {"message": "Not in queue"}}
                     )
 
-                    if position_data:
-                        expires_at_str = None
-                        if position_data.get("expires_at"):
-                            expires_at_str = position_data["expires_at"].isoformat()
-
-                        # Send the refreshed position to the client
-                        await queue_connection_manager.send_position_update(
-                            event_id=event_id,
-                            user_id=user_id,
-                            position=position_data["position"],
-                            status=position_data["status"],
-                            estimated_wait=position_data.get("estimated_wait_minutes"),
-                            total_ahead=position_data["total_ahead"],
-                            expires_at=expires_at_str,
-                            can_proceed=position_data.get("can_proceed", False),
-                        )
-                    else:
-                        # User left the queue or was removed while connected
-                        await websocket.send_json({
-                            "type": "error",
-                            "data": {"message": "Not in queue"}
-                        })
-
     except WebSocketDisconnect:
         # Clean disconnect: remove the connection from the manager
-        await queue_connection_manager.disconnect(event_id, user_id)
+        await queue_connection_manager.disconnect(event_id, user_id, websocket)
         logger.info(f"WebSocket disconnected: user {user_id} for event {event_id}")
     except Exception as e:
         # Unexpected error: log and clean up the connection
         logger.error(f"WebSocket error for user {user_id}: {e}")
-        await queue_connection_manager.disconnect(event_id, user_id)
+        await queue_connection_manager.disconnect(event_id, user_id, websocket)
@@ -3,6 +3,7 @@
 Wishlist API Routes
 """
 import fastapi
+from fastapi.responses import ORJSONResponse
 
 from src.api.dependencies.repository import get_repository
 from src.api.dependencies.auth import get_current_user
@@ -18,18 +19,20 @@ router = fastapi.APIRouter(prefix="/users/me/wishlist", tags=["wishlist"])
 
 # Helper to convert an Event ORM model into an EventResponse schema.
 # Includes a compact venue representation if the event has a linked venue.
+# The data comes straight from the database, so the models are built with
+# model_construct and skip field validation.
 def _build_event_response(event) -> EventResponse:
     """Build EventResponse from Event model"""
     venue = None
     if event.venue:
-        venue = VenueCompact(
+        venue = VenueCompact.model_construct(
             id=event.venue.id,
             name=event.venue.name,
             city=event.venue.city,
             state=event.venue.state,
         )
 
-    return EventResponse(
+    return EventResponse.model_construct(
         id=event.id,
         title=event.title,
         slug=event.slug,
@@ -69,14 +72,14 @@ async def get_wishlist(
     wishlist_repo: WishlistCRUDRepository = fastapi.Depends(
         get_repository(repo_type=WishlistCRUDRepository)
     ),
-) -> WishlistResponse:
+) -> ORJSONResponse:
     """Get user's wishlist"""
     # Fetch all wishlist items for the current user, eagerly loading related events
     items = await wishlist_repo.get_user_wishlist(account_id=current_user.id)
 
     # Transform each wishlist database record into a response schema with event details
     response_items = [
-        WishlistItemResponse(
+        WishlistItemResponse.model_construct(
             id=item.id,
             event_id=item.event_id,
             event=_build_event_response(item.event),
@@ -85,7 +88,10 @@ async def get_wishlist(
         for item in items
     ]
 
-    return WishlistResponse(items=response_items, total=len(response_items))
+    # Returned as a ready ORJSONResponse so FastAPI does not re-validate every item against
+    # response_model (kept for the OpenAPI schema); by_alias keeps the camelCase keys
+    wishlist = WishlistResponse.model_construct(items=response_items, total=len(response_items))
+    return ORJSONResponse(content=wishlist.model_dump(by_alias=True))
 
 
 # --- POST /users/me/wishlist/{event_id} ---
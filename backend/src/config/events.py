@@ -1,20 +1,30 @@
 # Lifecycle event handlers for the FastAPI application (startup and shutdown hooks)
+import asyncio
 import typing
 
 import fastapi
 import loguru
 
+from src.models.db import resolve_all as resolve_all_models
 from src.repository.events import dispose_db_connection, initialize_db_connection
+from src.workers.otp_cleanup import otp_cleanup_worker
 from src.workers.queue_processor import queue_processor
 
 
 # Returns an async callable that runs on application startup
 def execute_backend_server_event_handler(backend_app: fastapi.FastAPI) -> typing.Any:
     async def launch_backend_server_events() -> None:
-        # Establish the database connection pool and attach it to the app
-        await initialize_db_connection(backend_app=backend_app)
-        # Start the background queue processor for async task execution
-        await queue_processor.start()
+        # Register every ORM model before tables are created and relationships are resolved
+        resolve_all_models()
+        # Establish the database connection pool and start the background workers concurrently.
+        # The queue processor only touches the database for events with connected WebSocket
+        # users, none of which can exist before startup completes, and the OTP cleanup worker
+        # waits a full interval before its first sweep.
+        await asyncio.gather(
+            initialize_db_connection(backend_app=backend_app),
+            queue_processor.start(),
+            otp_cleanup_worker.start(),
+        )
 
     return launch_backend_server_events
 
@@ -24,8 +34,10 @@ def terminate_backend_server_event_handler(backend_app: fastapi.FastAPI) -> typi
     # loguru.logger.catch ensures any exceptions during shutdown are logged
     @loguru.logger.catch
     async def stop_backend_server_events() -> None:
-        # Gracefully stop the background queue processor
+        # Gracefully stop the background workers. This stays ahead of disposing the engine so
+        # an in-flight queue sweep or OTP cleanup never runs against a closed pool.
         await queue_processor.stop()
+        await otp_cleanup_worker.stop()
         # Close all database connections and release the connection pool
         await dispose_db_connection(backend_app=backend_app)
 
@@ -1,16 +1,28 @@
 # Settings manager -- uses a factory pattern to return the correct settings class
 # based on the ENVIRONMENT variable (DEV, STAGE, or PROD)
+import typing
 from functools import lru_cache
 
-import decouple
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from src.config.settings.base import BackendBaseSettings
+from src.config.settings.base import ENV_FILE, BackendBaseSettings
 from src.config.settings.development import BackendDevSettings
 from src.config.settings.environment import Environment
 from src.config.settings.production import BackendProdSettings
 from src.config.settings.staging import BackendStageSettings
 
 
+# Reads only the ENVIRONMENT selector, from the same sources as the settings themselves
+class EnvironmentSelector(BaseSettings):
+    ENVIRONMENT: str = Environment.DEVELOPMENT.value
+
+    model_config = SettingsConfigDict(
+        case_sensitive=True,
+        env_file=ENV_FILE,
+        extra="ignore",
+    )
+
+
 # Factory that maps an environment string to the corresponding settings class
 class BackendSettingsFactory:
     def __init__(self, environment: str):
@@ -27,10 +39,23 @@ class BackendSettingsFactory:
 
 
 # Cache the settings object so it is only constructed once across the application lifetime
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> BackendBaseSettings:
-    return BackendSettingsFactory(environment=decouple.config("ENVIRONMENT", default="DEV", cast=str))()  # type: ignore
+    return BackendSettingsFactory(environment=EnvironmentSelector().ENVIRONMENT)()
+
+
+# Module-level singleton used throughout the codebase to access configuration values.
+# Declared here but built on first access (see __getattr__), so importing this module alone
+# does not read or validate the environment.
+settings: BackendBaseSettings
+# Values read on every authenticated request/handshake; importers bind them once as plain constants
+JWT_SECRET_KEY: str
 
 
-# Module-level singleton used throughout the codebase to access configuration values
-settings: BackendBaseSettings = get_settings()
+# Resolve the lazily built module attributes above (PEP 562)
+def __getattr__(name: str) -> typing.Any:
+    if name == "settings":
+        return get_settings()
+    if name == "JWT_SECRET_KEY":
+        return get_settings().JWT_SECRET_KEY
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,29 @@
 # Base settings class -- defines all shared configuration values for the backend.
 # Environment-specific subclasses (dev, staging, prod) override selected fields.
+import functools
 import logging
 import pathlib
 
-import decouple
 import pydantic
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Resolve the project root directory (four levels up from this file) to locate the .env file
-ROOT_DIR: pathlib.Path = pathlib.Path(__file__).parent.parent.parent.parent.parent.resolve()
+# Resolve the project root directory (five levels up from this file) to locate the .env file
+ROOT_DIR: pathlib.Path = pathlib.Path(__file__).resolve().parents[4]
+# Path of the .env file, built once and shared by every settings class
+ENV_FILE: str = f"{ROOT_DIR}/.env"
+
+
+# Origins allowed by CORS unless overridden; an immutable tuple shared by every settings instance
+DEFAULT_ALLOWED_ORIGINS: tuple[str, ...] = (
+    "http://localhost:3000",  # React default port
+    "http://0.0.0.0:3000",
+    "http://127.0.0.1:3000",  # React docker port
+    "http://127.0.0.1:3001",
+    "http://localhost:5173",  # Qwik default port
+    "http://0.0.0.0:5173",
+    "http://127.0.0.1:5173",  # Qwik docker port
+    "http://127.0.0.1:5174",
+)
 
 
 class BackendBaseSettings(BaseSettings):
@@ -20,9 +35,11 @@ class BackendBaseSettings(BaseSettings):
     DEBUG: bool = False
 
     # --- Server configuration (loaded from environment variables) ---
-    SERVER_HOST: str = decouple.config("BACKEND_SERVER_HOST", cast=str)  # type: ignore
-    SERVER_PORT: int = decouple.config("BACKEND_SERVER_PORT", cast=int)  # type: ignore
-    SERVER_WORKERS: int = decouple.config("BACKEND_SERVER_WORKERS", cast=int)  # type: ignore
+    # Fields are filled by pydantic-settings from the environment and the .env file in one pass;
+    # `validation_alias` names the variable when it differs from the field name
+    SERVER_HOST: str = pydantic.Field(validation_alias="BACKEND_SERVER_HOST")
+    SERVER_PORT: int = pydantic.Field(validation_alias="BACKEND_SERVER_PORT")
+    SERVER_WORKERS: int = pydantic.Field(validation_alias="BACKEND_SERVER_WORKERS")
     API_PREFIX: str = "/api"
     DOCS_URL: str = "/docs"
     OPENAPI_URL: str = "/openapi.json"
@@ -30,98 +47,114 @@ class BackendBaseSettings(BaseSettings):
     OPENAPI_PREFIX: str = ""
 
     # --- PostgreSQL database connection settings ---
-    DB_POSTGRES_HOST: str = decouple.config("POSTGRES_HOST", cast=str)  # type: ignore
-    DB_MAX_POOL_CON: int = decouple.config("DB_MAX_POOL_CON", cast=int)  # type: ignore
-    DB_POSTGRES_NAME: str = decouple.config("POSTGRES_DB", cast=str)  # type: ignore
-    DB_POSTGRES_PASSWORD: str = decouple.config("POSTGRES_PASSWORD", cast=str)  # type: ignore
-    DB_POOL_SIZE: int = decouple.config("DB_POOL_SIZE", cast=int)  # type: ignore
-    DB_POOL_OVERFLOW: int = decouple.config("DB_POOL_OVERFLOW", cast=int)  # type: ignore
-    DB_POSTGRES_PORT: int = decouple.config("POSTGRES_PORT", cast=int)  # type: ignore
-    DB_POSTGRES_SCHEMA: str = decouple.config("POSTGRES_SCHEMA", cast=str)  # type: ignore
-    DB_TIMEOUT: int = decouple.config("DB_TIMEOUT", cast=int)  # type: ignore
-    DB_POSTGRES_USERNAME: str = decouple.config("POSTGRES_USERNAME", cast=str)  # type: ignore
+    DB_POSTGRES_HOST: str = pydantic.Field(validation_alias="POSTGRES_HOST")
+    DB_MAX_POOL_CON: int
+    DB_POSTGRES_NAME: str = pydantic.Field(validation_alias="POSTGRES_DB")
+    DB_POSTGRES_PASSWORD: str = pydantic.Field(validation_alias="POSTGRES_PASSWORD")
+    DB_POOL_SIZE: int
+    DB_POOL_OVERFLOW: int
+    DB_POSTGRES_PORT: int = pydantic.Field(validation_alias="POSTGRES_PORT")
+    DB_POSTGRES_SCHEMA: str = pydantic.Field(validation_alias="POSTGRES_SCHEMA")
+    DB_TIMEOUT: int
+    DB_POSTGRES_USERNAME: str = pydantic.Field(validation_alias="POSTGRES_USERNAME")
+    # Seconds after which a pooled connection is replaced instead of reused
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # Per-connection asyncpg prepared statement cache; ignored (forced to 0) when IS_DB_BEHIND_PGBOUNCER
+    DB_STATEMENT_CACHE_SIZE: int = 500
 
     # --- Database behaviour flags ---
-    IS_DB_ECHO_LOG: bool = decouple.config("IS_DB_ECHO_LOG", cast=bool)  # type: ignore
-    IS_DB_FORCE_ROLLBACK: bool = decouple.config("IS_DB_FORCE_ROLLBACK", cast=bool)  # type: ignore
-    IS_DB_EXPIRE_ON_COMMIT: bool = decouple.config("IS_DB_EXPIRE_ON_COMMIT", cast=bool)  # type: ignore
+    IS_DB_ECHO_LOG: bool
+    IS_DB_FORCE_ROLLBACK: bool
+    IS_DB_EXPIRE_ON_COMMIT: bool
+    # Ping pooled connections on checkout so dropped ones are replaced before use
+    IS_DB_POOL_PRE_PING: bool = True
+    # PgBouncer already pools server connections, so the app keeps none of its own
+    IS_DB_BEHIND_PGBOUNCER: bool = False
 
     # --- Authentication and JWT token settings ---
-    API_TOKEN: str = decouple.config("API_TOKEN", cast=str)  # type: ignore
-    AUTH_TOKEN: str = decouple.config("AUTH_TOKEN", cast=str)  # type: ignore
-    JWT_TOKEN_PREFIX: str = decouple.config("JWT_TOKEN_PREFIX", cast=str)  # type: ignore
-    JWT_SECRET_KEY: str = decouple.config("JWT_SECRET_KEY", cast=str)  # type: ignore
-    JWT_SUBJECT: str = decouple.config("JWT_SUBJECT", cast=str)  # type: ignore
-    JWT_MIN: int = decouple.config("JWT_MIN", cast=int)  # type: ignore
-    JWT_HOUR: int = decouple.config("JWT_HOUR", cast=int)  # type: ignore
-    JWT_DAY: int = decouple.config("JWT_DAY", cast=int)  # type: ignore
-    # Total JWT expiration time computed as the product of minutes, hours, and days
-    JWT_ACCESS_TOKEN_EXPIRATION_TIME: int = JWT_MIN * JWT_HOUR * JWT_DAY
+    API_TOKEN: str
+    AUTH_TOKEN: str
+    JWT_TOKEN_PREFIX: str
+    JWT_SECRET_KEY: str
+    JWT_SUBJECT: str
+    JWT_MIN: int
+    JWT_HOUR: int
+    JWT_DAY: int
+    # Upper bound on how long a token -> account resolution stays cached in a worker; block
+    # events only clear the cache of the worker that handled them, so this bounds staleness elsewhere
+    JWT_USER_CACHE_TTL_SECONDS: int = 60
 
     # --- CORS (Cross-Origin Resource Sharing) settings ---
-    IS_ALLOWED_CREDENTIALS: bool = decouple.config("IS_ALLOWED_CREDENTIALS", cast=bool)  # type: ignore
-    ALLOWED_ORIGINS: list[str] = [
-        "http://localhost:3000",  # React default port
-        "http://0.0.0.0:3000",
-        "http://127.0.0.1:3000",  # React docker port
-        "http://127.0.0.1:3001",
-        "http://localhost:5173",  # Qwik default port
-        "http://0.0.0.0:5173",
-        "http://127.0.0.1:5173",  # Qwik docker port
-        "http://127.0.0.1:5174",
-    ]
+    IS_ALLOWED_CREDENTIALS: bool
+    ALLOWED_ORIGINS: tuple[str, ...] = DEFAULT_ALLOWED_ORIGINS
     ALLOWED_METHODS: list[str] = ["*"]
     ALLOWED_HEADERS: list[str] = ["*"]
+    # How long browsers may cache a preflight response before sending another OPTIONS request
+    CORS_MAX_AGE_SECONDS: int = 86400
 
     # --- Logging configuration ---
     LOGGING_LEVEL: int = logging.INFO
     LOGGERS: tuple[str, str] = ("uvicorn.asgi", "uvicorn.access")
 
     # --- Password hashing and JWT algorithm settings ---
-    HASHING_ALGORITHM_LAYER_1: str = decouple.config("HASHING_ALGORITHM_LAYER_1", cast=str)  # type: ignore
-    HASHING_ALGORITHM_LAYER_2: str = decouple.config("HASHING_ALGORITHM_LAYER_2", cast=str)  # type: ignore
-    HASHING_SALT: str = decouple.config("HASHING_SALT", cast=str)  # type: ignore
-    JWT_ALGORITHM: str = decouple.config("JWT_ALGORITHM", cast=str)  # type: ignore
+    HASHING_ALGORITHM_LAYER_1: str
+    HASHING_ALGORITHM_LAYER_2: str
+    HASHING_SALT: str
+    JWT_ALGORITHM: str
 
     # --- Admin Configuration ---
-    ADMIN_EMAIL: str = decouple.config("ADMIN_EMAIL", default="admin@zoniq.com", cast=str)  # type: ignore
-    ADMIN_PASSWORD: str = decouple.config("ADMIN_PASSWORD", default="admin123!", cast=str)  # type: ignore
-    ADMIN_USERNAME: str = decouple.config("ADMIN_USERNAME", default="admin", cast=str)  # type: ignore
+    ADMIN_EMAIL: str = "admin@zoniq.com"
+    ADMIN_PASSWORD: str = "admin123!"
+    ADMIN_USERNAME: str = "admin"
 
     # --- OTP (One-Time Password) Configuration ---
-    OTP_EXPIRY_MINUTES: int = decouple.config("OTP_EXPIRY_MINUTES", default=10, cast=int)  # type: ignore
-    OTP_LENGTH: int = decouple.config("OTP_LENGTH", default=6, cast=int)  # type: ignore
+    OTP_EXPIRY_MINUTES: int = 10
+    OTP_LENGTH: int = 6
 
     # --- MSG91 SMS gateway Configuration ---
-    MSG91_AUTH_KEY: str = decouple.config("MSG91_AUTH_KEY", default="", cast=str)  # type: ignore
-    MSG91_OTP_TEMPLATE_ID: str = decouple.config("MSG91_OTP_TEMPLATE_ID", default="", cast=str)  # type: ignore
+    MSG91_AUTH_KEY: str = ""
+    MSG91_OTP_TEMPLATE_ID: str = ""
 
     # --- Razorpay payment gateway Configuration ---
-    RAZORPAY_KEY_ID: str = decouple.config("RAZORPAY_KEY_ID", default="", cast=str)  # type: ignore
-    RAZORPAY_KEY_SECRET: str = decouple.config("RAZORPAY_KEY_SECRET", default="", cast=str)  # type: ignore
-    RAZORPAY_WEBHOOK_SECRET: str = decouple.config("RAZORPAY_WEBHOOK_SECRET", default="", cast=str)  # type: ignore
+    RAZORPAY_KEY_ID: str = ""
+    RAZORPAY_KEY_SECRET: str = ""
+    RAZORPAY_WEBHOOK_SECRET: str = ""
 
     # --- Email/SMTP Configuration ---
-    SMTP_HOST: str = decouple.config("SMTP_HOST", default="smtp.gmail.com", cast=str)  # type: ignore
-    SMTP_PORT: int = decouple.config("SMTP_PORT", default=587, cast=int)  # type: ignore
-    SMTP_USERNAME: str = decouple.config("SMTP_USERNAME", default="", cast=str)  # type: ignore
-    SMTP_PASSWORD: str = decouple.config("SMTP_PASSWORD", default="", cast=str)  # type: ignore
-    SMTP_USE_TLS: bool = decouple.config("SMTP_USE_TLS", default=True, cast=bool)  # type: ignore
-    FROM_EMAIL: str = decouple.config("FROM_EMAIL", default="noreply@zoniq.com", cast=str)  # type: ignore
-    FROM_NAME: str = decouple.config("FROM_NAME", default="ZONIQ", cast=str)  # type: ignore
+    SMTP_HOST: str = "smtp.gmail.com"
+    SMTP_PORT: int = 587
+    SMTP_USERNAME: str = ""
+    SMTP_PASSWORD: str = ""
+    SMTP_USE_TLS: bool = True
+    FROM_EMAIL: str = "noreply@zoniq.com"
+    FROM_NAME: str = "ZONIQ"
 
     # --- Frontend URL used for constructing links in outbound emails ---
-    FRONTEND_URL: str = decouple.config("FRONTEND_URL", default="http://localhost:3000", cast=str)  # type: ignore
+    FRONTEND_URL: str = "http://localhost:3000"
 
-    # Pydantic settings model configuration: reads from .env, enforces case-sensitive keys
+    # Pydantic settings model configuration: reads from .env, enforces case-sensitive keys.
+    # Settings are read-only once loaded, so the model is frozen
     model_config = SettingsConfigDict(
         case_sensitive=True,
-        env_file=f"{str(ROOT_DIR)}/.env",
-        validate_assignment=True,
+        env_file=ENV_FILE,
+        frozen=True,
         extra="ignore",
     )
 
+    # Total JWT expiration time computed as the product of minutes, hours, and days
+    # (from this instance's values, so environment-specific overrides are honoured)
+    @pydantic.computed_field  # type: ignore[misc]
     @property
+    def JWT_ACCESS_TOKEN_EXPIRATION_TIME(self) -> int:
+        return self.JWT_MIN * self.JWT_HOUR * self.JWT_DAY
+
+    # CORS allowlist as a set, for constant-time origin membership checks
+    @functools.cached_property
+    def allowed_origins_set(self) -> frozenset[str]:
+        return frozenset(self.ALLOWED_ORIGINS)
+
+    # Built once per settings instance rather than on every access
+    @functools.cached_property
     def set_backend_app_attributes(self) -> dict[str, str | bool | None]:
         """
         Set all `FastAPI` class' attributes with the custom values defined in `BackendBaseSettings`.
@@ -1,16 +1,43 @@
-# Import all models so SQLAlchemy relationships resolve correctly
-from src.models.db.account import Account  # noqa: F401
-from src.models.db.event import Event  # noqa: F401
-from src.models.db.venue import Venue  # noqa: F401
-from src.models.db.seat_category import SeatCategory  # noqa: F401
-from src.models.db.seat import Seat  # noqa: F401
-from src.models.db.booking import Booking, BookingItem  # noqa: F401
-from src.models.db.cart import Cart, CartItem  # noqa: F401
-from src.models.db.payment import Payment  # noqa: F401
-from src.models.db.wishlist import Wishlist  # noqa: F401
-from src.models.db.queue_entry import QueueEntry  # noqa: F401
-from src.models.db.otp import OTPCode  # noqa: F401
-from src.models.db.ticket_transfer import TicketTransfer  # noqa: F401
-from src.models.db.notification_preference import NotificationPreference  # noqa: F401
-from src.models.db.user_device import UserDevice  # noqa: F401
-from src.models.db.admin_activity_log import AdminActivityLog  # noqa: F401
+# ORM models are imported on first access rather than with the package, so importing one model
+# module does not execute all of them. `resolve_all()` imports every model so SQLAlchemy
+# relationships (declared by class name) resolve; it runs at application startup.
+import importlib
+import typing
+
+# Model class name -> module defining it
+_MODEL_MODULES: dict[str, str] = {
+    "Account": "src.models.db.account",
+    "Event": "src.models.db.event",
+    "Venue": "src.models.db.venue",
+    "SeatCategory": "src.models.db.seat_category",
+    "Seat": "src.models.db.seat",
+    "Booking": "src.models.db.booking",
+    "BookingItem": "src.models.db.booking",
+    "Cart": "src.models.db.cart",
+    "CartItem": "src.models.db.cart",
+    "Payment": "src.models.db.payment",
+    "Wishlist": "src.models.db.wishlist",
+    "QueueEntry": "src.models.db.queue_entry",
+    "OTPCode": "src.models.db.otp",
+    "TicketTransfer": "src.models.db.ticket_transfer",
+    "NotificationPreference": "src.models.db.notification_preference",
+    "UserDevice": "src.models.db.user_device",
+    "AdminActivityLog": "src.models.db.admin_activity_log",
+}
+
+__all__ = [*_MODEL_MODULES, "resolve_all"]
+
+
+# PEP 562 hook: `from src.models.db import Account` imports only the account module
+def __getattr__(name: str) -> typing.Any:
+    module_path = _MODEL_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(importlib.import_module(module_path), name)
+
+
+# Import every model module once so all mappers are registered before the first query
+def resolve_all() -> None:
+    for module_path in dict.fromkeys(_MODEL_MODULES.values()):
+        importlib.import_module(module_path)
@@ -15,6 +15,11 @@ class UserRole(str, Enum):
     ADMIN = "admin"
 
 
+# Plain-string role values, resolved once instead of through the enum on every comparison
+_USER_ROLE: str = UserRole.USER.value
+_ADMIN_ROLE: str = UserRole.ADMIN.value
+
+
 # Database model for user accounts, storing credentials, profile info, and status flags
 class Account(Base):  # type: ignore
     __tablename__ = "account"
@@ -27,15 +32,16 @@ class Account(Base):  # type: ignore
     )
     # Unique email address for the account, used for notifications and login
     email: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=64), nullable=False, unique=True)
-    # Hashed password stored securely; prefixed with underscore to discourage direct access
-    _hashed_password: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=1024), nullable=True)
-    # Salt used in password hashing for added security
-    _hash_salt: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=1024), nullable=True)
+    # Hashed password stored securely; prefixed with underscore to discourage direct access.
+    # Sized for an Argon2 hash (~100 chars) with headroom for stronger parameters
+    _hashed_password: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=255), nullable=True)
+    # Salt used in password hashing for added security; a Bcrypt hash, always 60 chars
+    _hash_salt: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=60), nullable=True)
 
     # New fields for Phase 1
     # Role of the user: "user" or "admin", defaults to regular user
     role: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(
-        sqlalchemy.String(length=20), nullable=False, default=UserRole.USER.value
+        sqlalchemy.String(length=20), nullable=False, default=_USER_ROLE
     )
     # Optional phone number for the user, used for OTP verification
     phone: SQLAlchemyMapped[str | None] = sqlalchemy_mapped_column(sqlalchemy.String(length=20), nullable=True)
@@ -72,12 +78,27 @@ class Account(Base):  # type: ignore
         server_onupdate=sqlalchemy.schema.FetchedValue(for_update=True),
     )
 
+    # Emails are matched case-insensitively, so lookups go through lower(email);
+    # created_at serves the admin listing (newest first) and the new-user counts
+    __table_args__ = (
+        sqlalchemy.Index("ix_account_email_lower", sqlalchemy.text("lower(email)")),
+        sqlalchemy.Index("ix_account_created_at", "created_at"),
+    )
+
     # Eagerly load server-generated defaults after insert/update
     __mapper_args__ = {"eager_defaults": True}
 
     # Relationships
-    # One-to-many relationship with Wishlist; deleting an account removes its wishlist entries
-    wishlist_items = relationship("Wishlist", back_populates="account", cascade="all, delete-orphan")
+    # One-to-many relationship with Wishlist; deleting an account removes its wishlist entries.
+    # The FK cascades in the database, so the ORM never loads the collection just to delete it,
+    # and it is never loaded implicitly either: unloaded access raises instead of emitting a SELECT
+    wishlist_items = relationship(
+        "Wishlist",
+        back_populates="account",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
+    )
 
     # Property to safely read the hashed password without exposing the internal column
     @property
@@ -100,4 +121,4 @@ class Account(Base):  # type: ignore
     # Convenience property to check if the account holds admin privileges
     @property
     def is_admin(self) -> bool:
-        return self.role == UserRole.ADMIN.value
+        return self.role == _ADMIN_ROLE
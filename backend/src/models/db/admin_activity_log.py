@@ -3,6 +3,7 @@ import datetime
 from enum import Enum
 
 import sqlalchemy
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column
 from sqlalchemy.sql import functions as sqlalchemy_functions
 
@@ -56,8 +57,8 @@ class AdminActivityLog(Base):  # type: ignore
     entity_type: SQLAlchemyMapped[str | None] = sqlalchemy_mapped_column(sqlalchemy.String(length=50), nullable=True)
     # The ID of the specific entity that was acted upon
     entity_id: SQLAlchemyMapped[int | None] = sqlalchemy_mapped_column(sqlalchemy.Integer, nullable=True)
-    # JSON field for additional context about the action (e.g., old/new values, reason)
-    details: SQLAlchemyMapped[dict | None] = sqlalchemy_mapped_column(sqlalchemy.JSON, nullable=True)
+    # JSONB field for additional context about the action (e.g., old/new values, reason)
+    details: SQLAlchemyMapped[dict | None] = sqlalchemy_mapped_column(JSONB, nullable=True)
     # IP address of the admin at the time of the action, for security auditing
     ip_address: SQLAlchemyMapped[str | None] = sqlalchemy_mapped_column(sqlalchemy.String(length=45), nullable=True)
     # When the action was performed
@@ -65,5 +66,13 @@ class AdminActivityLog(Base):  # type: ignore
         sqlalchemy.DateTime(timezone=True), nullable=False, server_default=sqlalchemy_functions.now()
     )
 
+    # Indexes for the audit views: an admin's history newest-first, the global feed by time,
+    # and the history of a single entity
+    __table_args__ = (
+        sqlalchemy.Index("ix_admin_activity_log_admin_created", "admin_id", sqlalchemy.desc("created_at")),
+        sqlalchemy.Index("ix_admin_activity_log_created_at", "created_at"),
+        sqlalchemy.Index("ix_admin_activity_log_entity", "entity_type", "entity_id"),
+    )
+
     # Eagerly load server-generated defaults after insert/update
     __mapper_args__ = {"eager_defaults": True}
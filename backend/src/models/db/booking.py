@@ -1,6 +1,8 @@
 # Booking and BookingItem models -- represent confirmed ticket orders and individual tickets
 import datetime
+import os
 import uuid
+from decimal import Decimal
 
 import sqlalchemy
 from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column, relationship
@@ -17,7 +19,7 @@ class Booking(Base):
     """
     __tablename__ = "booking"
 
-    # Primary key, auto-incrementing integer
+    # Primary key, auto-incrementing integer; the sequence is cached, so IDs can have gaps
     id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(
         primary_key=True, autoincrement=True
     )
@@ -41,15 +43,15 @@ class Booking(Base):
     )  # pending, confirmed, cancelled, refunded
     # Pricing
     # Gross total before any discounts
-    total_amount: SQLAlchemyMapped[float] = sqlalchemy_mapped_column(
+    total_amount: SQLAlchemyMapped[Decimal] = sqlalchemy_mapped_column(
         sqlalchemy.Numeric(precision=10, scale=2), nullable=False
     )
     # Amount discounted (e.g., via promo code), defaults to 0
-    discount_amount: SQLAlchemyMapped[float] = sqlalchemy_mapped_column(
+    discount_amount: SQLAlchemyMapped[Decimal] = sqlalchemy_mapped_column(
         sqlalchemy.Numeric(precision=10, scale=2), nullable=False, default=0
     )
     # Net amount charged to the user after discounts (total_amount - discount_amount)
-    final_amount: SQLAlchemyMapped[float] = sqlalchemy_mapped_column(
+    final_amount: SQLAlchemyMapped[Decimal] = sqlalchemy_mapped_column(
         sqlalchemy.Numeric(precision=10, scale=2), nullable=False
     )
     # Payment
@@ -81,10 +83,11 @@ class Booking(Base):
         sqlalchemy.String(length=50), nullable=True
     )
     # Timestamps
-    # When the booking was created
+    # When the booking was created; stamped client-side on insert
     created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
         sqlalchemy.DateTime(timezone=True),
         nullable=False,
+        default=lambda: datetime.datetime.now(datetime.timezone.utc),
         server_default=sqlalchemy.func.now(),
     )
     # When the booking was last updated
@@ -96,15 +99,13 @@ class Booking(Base):
         sqlalchemy.DateTime(timezone=True), nullable=True
     )
 
-    # Eagerly load server-generated defaults after insert/update
-    __mapper_args__ = {"eager_defaults": True}
-
     # Indexes for commonly queried columns to improve lookup performance
     __table_args__ = (
-        sqlalchemy.Index("ix_booking_user", "user_id"),
-        sqlalchemy.Index("ix_booking_event", "event_id"),
+        # A user's bookings newest first, read straight off the index with no sort step
+        sqlalchemy.Index("ix_booking_user_created", "user_id", sqlalchemy.desc("created_at")),
+        # Serves per-event lookups as well as per-event status filters and date ordering
+        sqlalchemy.Index("ix_booking_event_status", "event_id", "status", "created_at"),
         sqlalchemy.Index("ix_booking_status", "status"),
-        sqlalchemy.Index("ix_booking_number", "booking_number"),
     )
 
     # Relationships
@@ -137,7 +138,7 @@ class BookingItem(Base):
     """
     __tablename__ = "booking_item"
 
-    # Primary key, auto-incrementing integer
+    # Primary key, auto-incrementing integer; the sequence is cached, so IDs can have gaps
     id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(
         primary_key=True, autoincrement=True
     )
@@ -155,7 +156,7 @@ class BookingItem(Base):
     )
     # Price snapshot at time of booking
     # Captures the price at checkout so later price changes do not affect existing bookings
-    price: SQLAlchemyMapped[float] = sqlalchemy_mapped_column(
+    price: SQLAlchemyMapped[Decimal] = sqlalchemy_mapped_column(
         sqlalchemy.Numeric(precision=10, scale=2), nullable=False
     )
     # Category name snapshot
@@ -169,7 +170,7 @@ class BookingItem(Base):
         sqlalchemy.String(length=50), nullable=True
     )
     # Ticket identification
-    # Unique ticket number used for entry validation (e.g., "TKT-A1B2C3D4")
+    # Unique ticket number used for entry validation (e.g., "TKT-A1B2C3D4E5F6")
     ticket_number: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(
         sqlalchemy.String(length=50), nullable=False, unique=True
     )
@@ -183,34 +184,41 @@ class BookingItem(Base):
         sqlalchemy.DateTime(timezone=True), nullable=True
     )
     # Timestamps
-    # When the booking item was created
+    # When the booking item was created; stamped client-side on insert
     created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
         sqlalchemy.DateTime(timezone=True),
         nullable=False,
+        default=lambda: datetime.datetime.now(datetime.timezone.utc),
         server_default=sqlalchemy.func.now(),
     )
 
-    # Eagerly load server-generated defaults after insert/update
-    __mapper_args__ = {"eager_defaults": True}
-
-    # Indexes for looking up items by booking and by ticket number
+    # Index for looking up items by booking; ticket number lookups use its unique constraint
     __table_args__ = (
         sqlalchemy.Index("ix_booking_item_booking", "booking_id"),
-        sqlalchemy.Index("ix_booking_item_ticket", "ticket_number"),
     )
 
     # Relationships
     # Many-to-one: each booking item belongs to one booking
     booking = relationship("Booking", back_populates="items")
-    # Many-to-one: each booking item references one seat category; eager-loaded via JOIN
-    category = relationship("SeatCategory", lazy="joined")
+    # Many-to-one: each booking item references one seat category. Tickets carry category_name
+    # and price snapshots for display, so the category is never loaded implicitly
+    category = relationship("SeatCategory", lazy="raise")
 
     def __repr__(self) -> str:
         return f"<BookingItem(id={self.id}, ticket='{self.ticket_number}')>"
 
-    # Generates a unique ticket number with the "TKT-" prefix and 8-character hex suffix
+    # Generates a unique ticket number with the "TKT-" prefix and 12-character hex suffix
     @staticmethod
     def generate_ticket_number() -> str:
-        """Generate a unique ticket number like TKT-A1B2C3D4"""
-        unique_part = uuid.uuid4().hex[:8].upper()
-        return f"TKT-{unique_part}"
+        """Generate a unique ticket number like TKT-A1B2C3D4E5F6"""
+        return BookingItem.generate_ticket_numbers(1)[0]
+
+    # Generates `count` ticket numbers from a single draw of random bytes, so a multi-ticket
+    # checkout reads the OS entropy source once instead of once per ticket. Each number carries
+    # 6 random bytes (48 bits), which keeps collisions on the unique constraint -- and the
+    # rolled-back checkout they cause -- negligible even after many millions of tickets
+    @staticmethod
+    def generate_ticket_numbers(count: int) -> list[str]:
+        """Generate `count` unique ticket numbers like TKT-A1B2C3D4E5F6"""
+        unique_parts = os.urandom(6 * count).hex().upper()
+        return [f"TKT-{unique_parts[i:i + 12]}" for i in range(0, 12 * count, 12)]
@@ -1,7 +1,9 @@
 # Cart and CartItem models -- represent a user's shopping cart for pending ticket selections
 import datetime
+from decimal import Decimal
 
 import sqlalchemy
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column, relationship
 
 from src.repository.table import Base
@@ -17,7 +19,7 @@ class Cart(Base):
     """
     __tablename__ = "cart"
 
-    # Primary key, auto-incrementing integer
+    # Primary key, auto-incrementing integer; the sequence is cached, so IDs can have gaps
     id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(
         primary_key=True, autoincrement=True
     )
@@ -40,10 +42,11 @@ class Cart(Base):
         sqlalchemy.DateTime(timezone=True), nullable=False
     )
     # Timestamps
-    # When the cart was created
+    # When the cart was created; stamped client-side on insert
     created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
         sqlalchemy.DateTime(timezone=True),
         nullable=False,
+        default=lambda: datetime.datetime.now(datetime.timezone.utc),
         server_default=sqlalchemy.func.now(),
     )
     # When the cart was last modified
@@ -51,34 +54,38 @@ class Cart(Base):
         sqlalchemy.DateTime(timezone=True), nullable=True
     )
 
-    # Eagerly load server-generated defaults after insert/update
-    __mapper_args__ = {"eager_defaults": True}
-
     # Composite index for quickly finding a user's cart for a specific event
     # Index on status for filtering active/expired carts
-    # Index on expires_at for background jobs that clean up expired carts
+    # Partial index on expires_at of active carts for background jobs that clean up expired carts
     __table_args__ = (
         sqlalchemy.Index("ix_cart_user_event", "user_id", "event_id"),
         sqlalchemy.Index("ix_cart_status", "status"),
-        sqlalchemy.Index("ix_cart_expires", "expires_at"),
+        sqlalchemy.Index(
+            "ix_cart_active_expiry", "expires_at", postgresql_where=sqlalchemy.text("status = 'active'")
+        ),
     )
 
     # Relationships
-    # One-to-many: a cart contains multiple cart items; eagerly loaded via SELECT IN
-    # Deleting a cart cascades to remove all its items
-    items = relationship("CartItem", back_populates="cart", lazy="selectin", cascade="all, delete-orphan")
+    # One-to-many: a cart contains multiple cart items; never loaded implicitly -- queries that
+    # need them opt in with an eager-load option. Deleting a cart cascades to remove all its items
+    items = relationship("CartItem", back_populates="cart", lazy="raise", cascade="all, delete-orphan")
     # Many-to-one: each cart references one event; eager-loaded via JOIN
     event = relationship("Event", lazy="joined")
 
     def __repr__(self) -> str:
         return f"<Cart(id={self.id}, user={self.user_id}, event={self.event_id}, status='{self.status}')>"
 
+    # Returns True if the given time is past the cart's expiration time; callers checking
+    # many carts read the clock once and pass it in
+    def is_expired_at(self, now: datetime.datetime) -> bool:
+        """Check if cart has expired as of `now`"""
+        return now > self.expires_at
+
     # Returns True if the current UTC time is past the cart's expiration time
     @property
     def is_expired(self) -> bool:
         """Check if cart has expired"""
-        now = datetime.datetime.now(datetime.timezone.utc)
-        return now > self.expires_at
+        return self.is_expired_at(datetime.datetime.now(datetime.timezone.utc))
 
     # Returns True if the cart status is "active" and it has not yet expired
     @property
@@ -96,7 +103,7 @@ class CartItem(Base):
     """
     __tablename__ = "cart_item"
 
-    # Primary key, auto-incrementing integer
+    # Primary key, auto-incrementing integer; the sequence is cached, so IDs can have gaps
     id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(
         primary_key=True, autoincrement=True
     )
@@ -108,10 +115,10 @@ class CartItem(Base):
     seat_category_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(
         sqlalchemy.ForeignKey("seat_category.id", ondelete="CASCADE"), nullable=False
     )
-    # For assigned seating -- specific seat IDs stored as JSON array
+    # For assigned seating -- specific seat IDs stored as a native integer array
     # Null for general admission where individual seats are not selected
-    seat_ids: SQLAlchemyMapped[list | None] = sqlalchemy_mapped_column(
-        sqlalchemy.JSON, nullable=True
+    seat_ids: SQLAlchemyMapped[list[int] | None] = sqlalchemy_mapped_column(
+        ARRAY(sqlalchemy.Integer), nullable=True
     )
     # Quantity (for general admission without specific seats)
     # Number of tickets selected for this category
@@ -120,7 +127,7 @@ class CartItem(Base):
     )
     # Price snapshot
     # Unit price captured at the time the item was added to the cart (guards against price changes)
-    unit_price: SQLAlchemyMapped[float] = sqlalchemy_mapped_column(
+    unit_price: SQLAlchemyMapped[Decimal] = sqlalchemy_mapped_column(
         sqlalchemy.Numeric(precision=10, scale=2), nullable=False
     )
     # Seat lock expiry
@@ -129,16 +136,14 @@ class CartItem(Base):
         sqlalchemy.DateTime(timezone=True), nullable=True
     )
     # Timestamps
-    # When the cart item was added
+    # When the cart item was added; stamped client-side on insert
     created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
         sqlalchemy.DateTime(timezone=True),
         nullable=False,
+        default=lambda: datetime.datetime.now(datetime.timezone.utc),
         server_default=sqlalchemy.func.now(),
     )
 
-    # Eagerly load server-generated defaults after insert/update
-    __mapper_args__ = {"eager_defaults": True}
-
     # Index on cart_id for efficiently retrieving all items belonging to a cart
     __table_args__ = (
         sqlalchemy.Index("ix_cart_item_cart", "cart_id"),
@@ -153,8 +158,8 @@ class CartItem(Base):
     def __repr__(self) -> str:
         return f"<CartItem(id={self.id}, category={self.seat_category_id}, qty={self.quantity})>"
 
-    # Calculates the total price for this cart item (unit_price * quantity)
+    # Calculates the total price for this cart item (unit_price * quantity), exact in Decimal
     @property
-    def subtotal(self) -> float:
+    def subtotal(self) -> Decimal:
         """Calculate subtotal for this item"""
-        return float(self.unit_price) * self.quantity
+        return self.unit_price * self.quantity
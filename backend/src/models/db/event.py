@@ -3,8 +3,9 @@ import datetime
 from enum import Enum
 
 import sqlalchemy
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column, relationship
-from sqlalchemy.dialects.postgresql import JSON, TSVECTOR
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 
 from src.repository.table import Base
 
@@ -125,14 +126,23 @@ class Event(Base):
         sqlalchemy.Integer, nullable=False, default=0
     )
     # Extra data (for flexible additional data)
-    # JSON field for storing arbitrary key-value data (e.g., custom attributes, metadata)
+    # JSONB field for storing arbitrary key-value data (e.g., custom attributes, metadata)
     extra_data: SQLAlchemyMapped[dict | None] = sqlalchemy_mapped_column(
-        JSON, nullable=True
+        JSONB, nullable=True
     )
-    # Full-text search vector (auto-populated by trigger)
-    # PostgreSQL TSVECTOR column for efficient full-text search on title/description
+    # Full-text search vector (generated column, computed by PostgreSQL on write)
+    # Weighted TSVECTOR over title, short description, organizer and description, kept in sync
+    # inside the row write itself and only recomputed when one of those columns changes
     search_vector = sqlalchemy_mapped_column(
-        TSVECTOR, nullable=True
+        TSVECTOR,
+        sqlalchemy.Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(short_description, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(organizer_name, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'C')",
+            persisted=True,
+        ),
+        nullable=True,
     )
     # Queue settings (for high-demand events)
     # Whether a virtual queue is enabled for this event to manage high demand
@@ -172,20 +182,45 @@ class Event(Base):
         sqlalchemy.DateTime(timezone=True), nullable=True
     )
 
-    # Eagerly load server-generated defaults after insert/update
-    __mapper_args__ = {"eager_defaults": True}
+    # GIN index serving `search_vector @@ tsquery` lookups, the listing and foreign key indexes,
+    # and the seat count constraint
+    __table_args__ = (
+        sqlalchemy.Index("ix_event_search_vector", "search_vector", postgresql_using="gin"),
+        # Listings filter by status and order by event date; the leading column also serves
+        # status-only filters
+        sqlalchemy.Index("ix_event_status_date", "status", "event_date"),
+        # Foreign keys: venue lookups, and the ON DELETE SET NULL checks when a venue or
+        # admin account is deleted
+        sqlalchemy.Index("ix_event_venue_id", "venue_id"),
+        sqlalchemy.Index("ix_event_created_by", "created_by"),
+        # Checkout decrements available_seats with a guarded UPDATE; the database rejects oversells
+        sqlalchemy.CheckConstraint("available_seats >= 0", name="ck_event_seats_nonneg"),
+    )
+
+    # Eagerly load server-generated defaults after insert. Updates do not fetch them back, so
+    # seat-count updates at checkout never return the generated search_vector
+    __mapper_args__ = {"eager_defaults": "auto"}
 
     # Relationships (loaded lazily by default)
-    # Many-to-one: each event belongs to one venue; eager-loaded via JOIN for performance
-    venue = relationship("Venue", lazy="joined")
-    # One-to-many: wishlist entries referencing this event; cascade deletes on event removal
-    wishlist_items = relationship("Wishlist", back_populates="event", cascade="all, delete-orphan")
+    # Many-to-one: each event belongs to one venue; eager-loaded via SELECT IN so event listings
+    # are not widened with venue columns. Single-event lookups opt into a JOIN explicitly
+    venue = relationship("Venue", lazy="selectin")
+    # One-to-many: wishlist entries referencing this event; the FK's ON DELETE CASCADE removes them.
+    # Never loaded implicitly: touching it unloaded raises instead of issuing a SELECT per event
+    wishlist_items = relationship(
+        "Wishlist",
+        back_populates="event",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
+    )
 
     def __repr__(self) -> str:
         return f"<Event(id={self.id}, title='{self.title}', status='{self.status}')>"
 
-    # Returns True if the event is published and the current time falls within the booking window
-    @property
+    # Returns True if the event is published and the current time falls within the booking window.
+    # Also usable in queries, e.g. `select(Event).where(Event.is_booking_open)`
+    @hybrid_property
     def is_booking_open(self) -> bool:
         """Check if booking is currently open for this event"""
         now = datetime.datetime.now(datetime.timezone.utc)
@@ -194,8 +229,21 @@ class Event(Base):
             and self.booking_start_date <= now <= self.booking_end_date
         )
 
-    # Returns True if no seats remain for this event
-    @property
+    @is_booking_open.expression
+    def is_booking_open(cls) -> sqlalchemy.ColumnElement[bool]:
+        now = sqlalchemy.func.now()
+        return sqlalchemy.and_(
+            cls.status == EventStatus.PUBLISHED.value,
+            cls.booking_start_date <= now,
+            cls.booking_end_date >= now,
+        )
+
+    # Returns True if no seats remain for this event; also usable in queries
+    @hybrid_property
     def is_soldout(self) -> bool:
         """Check if event is sold out"""
         return self.available_seats <= 0
+
+    @is_soldout.expression
+    def is_soldout(cls) -> sqlalchemy.ColumnElement[bool]:
+        return cls.available_seats <= 0
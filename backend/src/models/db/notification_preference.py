@@ -66,9 +66,10 @@ class NotificationPreference(Base):
     )
 
     # Relationships
-    # One-to-one: links back to the user's account; eager-loaded via JOIN
+    # One-to-one: links back to the user's account. Preferences are always looked up by user_id,
+    # so the account is never loaded implicitly; queries that need it opt in with joinedload()
     # Uses backref to make notification_preferences accessible from the Account model
-    user = relationship("Account", backref="notification_preferences", lazy="joined")
+    user = relationship("Account", backref="notification_preferences", lazy="raise")
 
     # Eagerly load server-generated defaults after insert/update
     __mapper_args__ = {"eager_defaults": True}
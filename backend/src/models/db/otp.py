@@ -3,6 +3,7 @@ import datetime
 from enum import Enum
 
 import sqlalchemy
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column
 from sqlalchemy.sql import functions as sqlalchemy_functions
 
@@ -34,8 +35,8 @@ class OTPCode(Base):  # type: ignore
     phone: SQLAlchemyMapped[str | None] = sqlalchemy_mapped_column(sqlalchemy.String(length=20), nullable=True)
     # Email address the OTP was sent to (for email-based OTPs)
     email: SQLAlchemyMapped[str | None] = sqlalchemy_mapped_column(sqlalchemy.String(length=255), nullable=True)
-    # The actual OTP code (e.g., "123456"), stored as a string to preserve leading zeros
-    code: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=10), nullable=False)
+    # Keyed hash (HMAC-SHA256) of the OTP code; the plaintext code is never stored
+    code: SQLAlchemyMapped[bytes] = sqlalchemy_mapped_column(sqlalchemy.LargeBinary(length=32), nullable=False)
     # Purpose of this OTP (login, verify_phone, verify_email, reset_password, email_login)
     purpose: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=50), nullable=False)
     # Expiration timestamp; the OTP becomes invalid after this time
@@ -52,12 +53,38 @@ class OTPCode(Base):  # type: ignore
     # Eagerly load server-generated defaults after insert/update
     __mapper_args__ = {"eager_defaults": True}
 
-    # Returns True if the current time is past the OTP's expiration
-    @property
+    # Partial indexes serving get_valid_otp: only unused codes are indexed, so they stay tiny
+    __table_args__ = (
+        sqlalchemy.Index(
+            "ix_otp_code_active_email_lookup",
+            "purpose",
+            "email",
+            "code",
+            postgresql_where=sqlalchemy.text("is_used = false"),
+        ),
+        sqlalchemy.Index(
+            "ix_otp_code_active_phone_lookup",
+            "purpose",
+            "phone",
+            "code",
+            postgresql_where=sqlalchemy.text("is_used = false"),
+        ),
+    )
+
+    # Returns True if the current time is past the OTP's expiration; also usable in queries
+    @hybrid_property
     def is_expired(self) -> bool:
         return datetime.datetime.now(datetime.timezone.utc) > self.expires_at
 
+    @is_expired.expression
+    def is_expired(cls) -> sqlalchemy.ColumnElement[bool]:
+        return cls.expires_at < sqlalchemy_functions.now()
+
     # Returns True if the OTP has not been used and has not expired (still valid for verification)
-    @property
+    @hybrid_property
     def is_valid(self) -> bool:
         return not self.is_used and not self.is_expired
+
+    @is_valid.expression
+    def is_valid(cls) -> sqlalchemy.ColumnElement[bool]:
+        return sqlalchemy.and_(cls.is_used.is_(False), cls.expires_at > sqlalchemy_functions.now())
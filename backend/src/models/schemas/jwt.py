@@ -21,3 +21,6 @@ class JWTAccount(pydantic.BaseModel):
     email: pydantic.EmailStr
     # Role of the user (defaults to "user"; can be "admin")
     role: str = "user"
+    # Numeric account ID, so consumers can skip the username -> account lookup
+    # (absent from tokens issued before this claim was introduced)
+    user_id: int | None = None
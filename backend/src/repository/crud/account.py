@@ -3,17 +3,24 @@ import datetime
 import typing
 
 import sqlalchemy
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql import functions as sqlalchemy_functions
 
 from src.models.db.account import Account, UserRole
 from src.models.schemas.account import AccountInCreate, AccountInLogin, AccountInUpdate, AccountProfileUpdate
 from src.repository.crud.base import BaseCRUDRepository
+from src.securities.authorizations.token_cache import jwt_user_cache
 from src.securities.hashing.password import pwd_generator
-from src.securities.verifications.credentials import credential_verifier
 from src.utilities.exceptions.database import EntityAlreadyExists, EntityDoesNotExist
 from src.utilities.exceptions.password import PasswordDoesNotMatch
 
 
+# Ordering for lower(email) lookups: older rows may differ only by case, so the exact-case
+# match wins and the oldest account breaks any remaining tie
+def email_match_order(email: str) -> tuple:
+    return (sqlalchemy.case((Account.email == email, 0), else_=1), Account.id)
+
+
 class AccountCRUDRepository(BaseCRUDRepository):
     # Creates a new user account with hashed password and salt, then persists it to the database
     async def create_account(
@@ -60,6 +67,12 @@ class AccountCRUDRepository(BaseCRUDRepository):
 
         return query.scalar()  # type: ignore
 
+    # Reads only the blocked flag of an account by primary key; None if the account does not exist
+    async def read_account_block_status(self, account_id: int) -> bool | None:
+        stmt = sqlalchemy.select(Account.is_blocked).where(Account.id == account_id)
+        query = await self.async_session.execute(statement=stmt)
+        return query.scalar()
+
     # Fetches a single account by its unique username
     async def read_account_by_username(self, username: str) -> Account:
         stmt = sqlalchemy.select(Account).where(Account.username == username)
@@ -70,9 +83,14 @@ class AccountCRUDRepository(BaseCRUDRepository):
 
         return query.scalar()  # type: ignore
 
-    # Fetches a single account by its unique email address
+    # Fetches a single account by its email address, ignoring case
     async def read_account_by_email(self, email: str) -> Account:
-        stmt = sqlalchemy.select(Account).where(Account.email == email)
+        stmt = (
+            sqlalchemy.select(Account)
+            .where(sqlalchemy.func.lower(Account.email) == email.lower())
+            .order_by(*email_match_order(email))
+            .limit(1)
+        )
         query = await self.async_session.execute(statement=stmt)
 
         if not query:
@@ -83,8 +101,14 @@ class AccountCRUDRepository(BaseCRUDRepository):
     # Authenticates a user by matching username+email and verifying the password hash
     # Raises EntityDoesNotExist if credentials don't match, PasswordDoesNotMatch if password is wrong
     async def read_user_by_password_authentication(self, account_login: AccountInLogin) -> Account:
-        stmt = sqlalchemy.select(Account).where(
-            Account.username == account_login.username, Account.email == account_login.email
+        stmt = (
+            sqlalchemy.select(Account)
+            .where(
+                Account.username == account_login.username,
+                sqlalchemy.func.lower(Account.email) == account_login.email.lower(),
+            )
+            .order_by(*email_match_order(account_login.email))
+            .limit(1)
         )
         query = await self.async_session.execute(statement=stmt)
         db_account = query.scalar()
@@ -140,30 +164,22 @@ class AccountCRUDRepository(BaseCRUDRepository):
 
         await self.async_session.execute(statement=stmt)
         await self.async_session.commit()
+        # Tokens issued to the deleted account must stop resolving from the cache
+        jwt_user_cache.invalidate_user(user_id=id)
 
         return f"Account with id '{id}' is successfully deleted!"
 
-    # Checks if a username is already taken; raises EntityAlreadyExists if so
+    # Checks whether a username is already taken; a single EXISTS probe, no row fetch
     async def is_username_taken(self, username: str) -> bool:
-        username_stmt = sqlalchemy.select(Account.username).select_from(Account).where(Account.username == username)
-        username_query = await self.async_session.execute(username_stmt)
-        db_username = username_query.scalar()
-
-        if not credential_verifier.is_username_available(username=db_username):
-            raise EntityAlreadyExists(f"The username `{username}` is already taken!")  # type: ignore
-
-        return True
+        stmt = sqlalchemy.select(sqlalchemy.exists().where(Account.username == username))
+        query = await self.async_session.execute(statement=stmt)
+        return bool(query.scalar())
 
-    # Checks if an email is already registered; raises EntityAlreadyExists if so
+    # Checks whether an email is already registered; a single EXISTS probe, no row fetch
     async def is_email_taken(self, email: str) -> bool:
-        email_stmt = sqlalchemy.select(Account.email).select_from(Account).where(Account.email == email)
-        email_query = await self.async_session.execute(email_stmt)
-        db_email = email_query.scalar()
-
-        if not credential_verifier.is_email_available(email=db_email):
-            raise EntityAlreadyExists(f"The email `{email}` is already registered!")  # type: ignore
-
-        return True
+        stmt = sqlalchemy.select(sqlalchemy.exists().where(sqlalchemy.func.lower(Account.email) == email.lower()))
+        query = await self.async_session.execute(statement=stmt)
+        return bool(query.scalar())
 
     # ==================== Email OTP methods ====================
 
@@ -237,25 +253,69 @@ class AccountCRUDRepository(BaseCRUDRepository):
         await self.async_session.commit()
         return await self.read_account_by_id(id=account_id)
 
-    # Updates user profile fields (username, email, phone, full_name) that are provided
-    # Skips the update if no fields are provided and returns the current account
-    async def update_profile(self, account_id: int, profile_update: AccountProfileUpdate) -> Account:
-        """Update user profile"""
+    # Applies a profile update in a single UPDATE ... RETURNING round-trip. Uniqueness of a new
+    # username/email is checked in the same statement through NOT EXISTS guards. Two concurrent
+    # updates can still both pass the guards under READ COMMITTED; the loser then hits the unique
+    # constraint, which is reported the same way. Raises EntityAlreadyExists when the new
+    # username/email belongs to another account, EntityDoesNotExist when the account is gone.
+    async def update_profile_checked(self, account_id: int, profile_update: AccountProfileUpdate) -> Account:
+        """Update user profile, rejecting usernames/emails that belong to another account"""
         update_data = profile_update.dict(exclude_unset=True, exclude_none=True)
 
         if not update_data:
             # Nothing to update, return current account
             return await self.read_account_by_id(id=account_id)
 
+        # "Taken" means owned by another account: resending the caller's own value is never a conflict
+        other_account = aliased(Account)
+        username_taken = email_taken = None
+        if "username" in update_data:
+            username_taken = sqlalchemy.exists().where(
+                other_account.username == update_data["username"],
+                other_account.id != account_id,
+            )
+        if "email" in update_data:
+            email_taken = sqlalchemy.exists().where(
+                sqlalchemy.func.lower(other_account.email) == update_data["email"].lower(),
+                other_account.id != account_id,
+            )
+
+        stmt = sqlalchemy.update(Account).where(Account.id == account_id)
+        for guard in (username_taken, email_taken):
+            if guard is not None:
+                stmt = stmt.where(~guard)
+
         stmt = (
-            sqlalchemy.update(Account)
-            .where(Account.id == account_id)
-            .values(**update_data, updated_at=sqlalchemy_functions.now())
+            stmt.values(**update_data, updated_at=sqlalchemy_functions.now())
+            .returning(Account)
+            .execution_options(populate_existing=True)
         )
-        await self.async_session.execute(statement=stmt)
-        await self.async_session.commit()
+        try:
+            query = await self.async_session.execute(statement=stmt)
+            updated_account = query.scalar()
+            await self.async_session.commit()
+        except sqlalchemy.exc.IntegrityError:
+            # A concurrent update claimed the username/email after the guards were evaluated
+            await self.async_session.rollback()
+            updated_account = None
+
+        if updated_account:
+            return updated_account
+
+        # No row came back: find out which guard rejected the update for the error message
+        if username_taken is not None and await self.async_session.scalar(sqlalchemy.select(username_taken)):
+            raise EntityAlreadyExists("Username is already taken")
+        if email_taken is not None and await self.async_session.scalar(sqlalchemy.select(email_taken)):
+            raise EntityAlreadyExists("Email is already registered")
+
+        account_exists = await self.async_session.scalar(
+            sqlalchemy.select(sqlalchemy.exists().where(Account.id == account_id))
+        )
+        if not account_exists:
+            raise EntityDoesNotExist(f"Account with id `{account_id}` does not exist!")
 
-        return await self.read_account_by_id(id=account_id)
+        # The conflicting account changed or disappeared between the update and the probe
+        raise EntityAlreadyExists("Username or email was changed concurrently, please retry")
 
     # Marks the user's phone number as verified in the database
     async def verify_phone(self, account_id: int) -> None:
@@ -303,6 +363,9 @@ class AccountCRUDRepository(BaseCRUDRepository):
         await self.async_session.execute(statement=stmt)
         await self.async_session.commit()
 
+        # Force cached tokens of this user back through the account lookup
+        jwt_user_cache.invalidate_user(user_id=account_id)
+
     # ==================== Admin methods ====================
 
     # Retrieves a paginated list of accounts with optional search filtering
@@ -355,6 +418,8 @@ class AccountCRUDRepository(BaseCRUDRepository):
         )
         await self.async_session.execute(statement=stmt)
         await self.async_session.commit()
+        # Cached tokens still carry the unblocked state; drop them
+        jwt_user_cache.invalidate_user(user_id=account_id)
 
         return await self.read_account_by_id(id=account_id)
 
@@ -372,6 +437,8 @@ class AccountCRUDRepository(BaseCRUDRepository):
         )
         await self.async_session.execute(statement=stmt)
         await self.async_session.commit()
+        # Cached tokens still carry the blocked state; drop them
+        jwt_user_cache.invalidate_user(user_id=account_id)
 
         return await self.read_account_by_id(id=account_id)
 
@@ -4,9 +4,10 @@
 
 import datetime
 import typing
+from decimal import Decimal
 
 import sqlalchemy
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 from sqlalchemy.sql import functions as sqlalchemy_functions
 
 from src.models.db.booking import Booking, BookingItem
@@ -32,97 +33,167 @@ class BookingCRUDRepository(BaseCRUDRepository):
     ) -> Booking:
         """Create a booking from a cart, generating booking items and marking seats as booked."""
         # Calculate totals
-        # Subtotal is the sum of (unit_price * quantity) across all cart items.
-        subtotal = sum(float(item.unit_price) * item.quantity for item in cart.items)
+        # Subtotal is the sum of (unit_price * quantity) across all cart items, kept in Decimal.
+        subtotal = sum((item.subtotal for item in cart.items), Decimal("0"))
         final_amount = subtotal
         ticket_count = sum(item.quantity for item in cart.items)
+        now = datetime.datetime.now(datetime.timezone.utc)
 
-        # Create booking with pending status (awaiting Razorpay payment)
-        booking = Booking(
-            booking_number=Booking.generate_booking_number(),
-            user_id=user_id,
-            event_id=cart.event_id,
-            status="pending",
-            total_amount=subtotal,
-            discount_amount=0.0,
-            final_amount=final_amount,
-            payment_status="pending",  # Requires Razorpay payment to complete
-            ticket_count=ticket_count,
-            contact_email=contact_email,
-            contact_phone=contact_phone,
-        )
-        self.async_session.add(booking)
-        # Flush to obtain the auto-generated booking.id before creating child items.
-        await self.async_session.flush()  # Get booking.id
-
-        # Create booking items from cart items
+        # Load every assigned seat in the cart with one query rather than one per seat
+        cart_seat_ids = [seat_id for cart_item in cart.items for seat_id in cart_item.seat_ids or []]
+        seats_by_id: dict[int, Seat] = {}
+        if cart_seat_ids:
+            seat_stmt = sqlalchemy.select(Seat).where(Seat.id.in_(cart_seat_ids))
+            seat_result = await self.async_session.execute(seat_stmt)
+            seats_by_id = {seat.id: seat for seat in seat_result.scalars()}
+
+        # Build one row per ticket: (seat_id, category_id, price, category_name, seat_label, ticket_number)
+        item_rows: list[tuple] = []
+        booked_seats: list[Seat] = []
         for cart_item in cart.items:
+            category_name = cart_item.seat_category.name if cart_item.seat_category else "Unknown"
             seat_ids = cart_item.seat_ids or []
             if seat_ids:
                 # Assigned seating: create one BookingItem per seat
                 # Each seat gets its own ticket with a unique ticket number.
-                for seat_id in seat_ids:
-                    # Get seat label
-                    seat_stmt = sqlalchemy.select(Seat).where(Seat.id == seat_id)
-                    seat_result = await self.async_session.execute(seat_stmt)
-                    seat = seat_result.scalar_one_or_none()
-
-                    booking_item = BookingItem(
-                        booking_id=booking.id,
-                        seat_id=seat_id,
-                        category_id=cart_item.seat_category_id,
-                        price=cart_item.unit_price,
-                        category_name=cart_item.seat_category.name if cart_item.seat_category else "Unknown",
-                        seat_label=seat.seat_label if seat else None,
-                        ticket_number=BookingItem.generate_ticket_number(),
+                ticket_numbers = BookingItem.generate_ticket_numbers(len(seat_ids))
+                for seat_id, ticket_number in zip(seat_ids, ticket_numbers):
+                    seat = seats_by_id.get(seat_id)
+                    item_rows.append(
+                        (
+                            seat_id,
+                            cart_item.seat_category_id,
+                            cart_item.unit_price,
+                            category_name,
+                            seat.seat_label if seat else None,
+                            ticket_number,
+                        )
                     )
-                    self.async_session.add(booking_item)
 
-                    # Mark seat as booked and clear lock metadata.
                     if seat:
-                        seat.status = SeatStatus.BOOKED.value
-                        seat.booking_id = booking.id
-                        seat.locked_until = None
-                        seat.locked_by = None
+                        booked_seats.append(seat)
             else:
                 # General admission: create quantity BookingItems
                 # No specific seat assignment -- seat_id is None.
-                for _ in range(cart_item.quantity):
-                    booking_item = BookingItem(
-                        booking_id=booking.id,
-                        seat_id=None,
-                        category_id=cart_item.seat_category_id,
-                        price=cart_item.unit_price,
-                        category_name=cart_item.seat_category.name if cart_item.seat_category else "Unknown",
-                        seat_label=None,
-                        ticket_number=BookingItem.generate_ticket_number(),
+                for ticket_number in BookingItem.generate_ticket_numbers(cart_item.quantity):
+                    item_rows.append(
+                        (
+                            None,
+                            cart_item.seat_category_id,
+                            cart_item.unit_price,
+                            category_name,
+                            None,
+                            ticket_number,
+                        )
                     )
-                    self.async_session.add(booking_item)
 
-                # Decrement available seats for the category
-                # Use max(0, ...) to prevent negative seat counts from race conditions.
-                cat_stmt = sqlalchemy.select(SeatCategory).where(SeatCategory.id == cart_item.seat_category_id)
+                # Decrement available seats for the category in one guarded UPDATE: no row is
+                # updated when a concurrent checkout already took the remaining seats.
+                cat_stmt = (
+                    sqlalchemy.update(SeatCategory)
+                    .where(
+                        SeatCategory.id == cart_item.seat_category_id,
+                        SeatCategory.available_seats >= cart_item.quantity,
+                    )
+                    .values(available_seats=SeatCategory.available_seats - cart_item.quantity)
+                    .returning(SeatCategory.id)
+                )
                 cat_result = await self.async_session.execute(cat_stmt)
-                category = cat_result.scalar_one_or_none()
-                if category:
-                    category.available_seats = max(0, category.available_seats - cart_item.quantity)
-
-        # Update event available seats
+                if cat_result.scalar_one_or_none() is None:
+                    raise ValueError(f"Not enough seats available in {category_name}")
+
+        # Insert the booking and all of its tickets in one statement: the booking insert runs
+        # in a CTE whose returned ID feeds the booking_item insert, so checkout costs a single
+        # round trip for both tables. Booking with pending status (awaiting Razorpay payment).
+        new_booking = (
+            sqlalchemy.insert(Booking)
+            .values(
+                booking_number=Booking.generate_booking_number(),
+                user_id=user_id,
+                event_id=cart.event_id,
+                status="pending",
+                total_amount=subtotal,
+                discount_amount=Decimal("0"),
+                final_amount=final_amount,
+                payment_status="pending",  # Requires Razorpay payment to complete
+                ticket_count=ticket_count,
+                contact_email=contact_email,
+                contact_phone=contact_phone,
+                created_at=now,
+            )
+            .returning(Booking.id)
+            .cte("new_booking")
+        )
+        ticket_rows = sqlalchemy.values(
+            sqlalchemy.column("seat_id", sqlalchemy.Integer),
+            sqlalchemy.column("category_id", sqlalchemy.Integer),
+            sqlalchemy.column("price", sqlalchemy.Numeric(precision=10, scale=2)),
+            sqlalchemy.column("category_name", sqlalchemy.String),
+            sqlalchemy.column("seat_label", sqlalchemy.String),
+            sqlalchemy.column("ticket_number", sqlalchemy.String),
+            name="ticket_rows",
+        ).data(item_rows)
+        items_stmt = (
+            sqlalchemy.insert(BookingItem)
+            .from_select(
+                [
+                    "booking_id",
+                    "seat_id",
+                    "category_id",
+                    "price",
+                    "category_name",
+                    "seat_label",
+                    "ticket_number",
+                    "is_used",
+                    "created_at",
+                ],
+                sqlalchemy.select(
+                    new_booking.c.id,
+                    ticket_rows.c.seat_id,
+                    ticket_rows.c.category_id,
+                    ticket_rows.c.price,
+                    ticket_rows.c.category_name,
+                    ticket_rows.c.seat_label,
+                    ticket_rows.c.ticket_number,
+                    sqlalchemy.literal(False),
+                    sqlalchemy.literal(now, sqlalchemy.DateTime(timezone=True)),
+                ).select_from(new_booking.join(ticket_rows, sqlalchemy.true())),
+            )
+            .returning(BookingItem.booking_id)
+        )
+        # A validated cart is never empty, so the insert returns at least one row
+        items_result = await self.async_session.execute(items_stmt)
+        booking_id = items_result.scalars().first()
+
+        # Mark seats as booked and clear lock metadata. Done after the insert so autoflush
+        # does not write each seat twice.
+        for seat in booked_seats:
+            seat.status = SeatStatus.BOOKED.value
+            seat.booking_id = booking_id
+            seat.locked_until = None
+            seat.locked_by = None
+
+        # Update event available seats with the same guarded UPDATE; the ck_event_seats_nonneg
+        # constraint backs it up so the count can never go negative
         from src.models.db.event import Event
-        event_stmt = sqlalchemy.select(Event).where(Event.id == cart.event_id)
+        event_stmt = (
+            sqlalchemy.update(Event)
+            .where(Event.id == cart.event_id, Event.available_seats >= ticket_count)
+            .values(available_seats=Event.available_seats - ticket_count)
+            .returning(Event.id)
+        )
         event_result = await self.async_session.execute(event_stmt)
-        event = event_result.scalar_one_or_none()
-        if event:
-            event.available_seats = max(0, event.available_seats - ticket_count)
+        if event_result.scalar_one_or_none() is None:
+            raise ValueError("Not enough seats available for this event")
 
         # Mark cart as converted so it cannot be reused.
         cart.status = "converted"
-        cart.updated_at = datetime.datetime.now(datetime.timezone.utc)
+        cart.updated_at = now
 
         await self.async_session.commit()
 
         # Reload booking with relationships
-        return await self.read_booking_by_id(booking.id)
+        return await self.read_booking_by_id(booking_id)
 
     # Fetches a booking by primary key with eager-loaded items (including category)
     # and event. Raises EntityDoesNotExist if not found.
@@ -131,7 +202,7 @@ class BookingCRUDRepository(BaseCRUDRepository):
         stmt = (
             sqlalchemy.select(Booking)
             .options(
-                joinedload(Booking.items).joinedload(BookingItem.category),
+                selectinload(Booking.items),
                 joinedload(Booking.event),
             )
             .where(Booking.id == booking_id)
@@ -149,7 +220,7 @@ class BookingCRUDRepository(BaseCRUDRepository):
         stmt = (
             sqlalchemy.select(Booking)
             .options(
-                joinedload(Booking.items).joinedload(BookingItem.category),
+                selectinload(Booking.items),
                 joinedload(Booking.event),
             )
             .where(Booking.booking_number == booking_number)
@@ -181,10 +252,16 @@ class BookingCRUDRepository(BaseCRUDRepository):
         count_result = await self.async_session.execute(count_stmt)
         total = count_result.scalar() or 0
 
-        # Data query -- ordered by most recent first.
+        # Data query -- ordered by most recent first. The event is fetched with one SELECT IN
+        # for the page rather than joined onto every row; the listing never reads the owner
+        # (the current user) or the tickets, so those relationships are not loaded at all.
         stmt = (
             sqlalchemy.select(Booking)
-            .options(joinedload(Booking.event))
+            .options(
+                selectinload(Booking.event),
+                raiseload(Booking.user),
+                raiseload(Booking.items),
+            )
             .where(Booking.user_id == user_id)
             .order_by(Booking.created_at.desc())
             .limit(page_size)
@@ -33,8 +33,11 @@ class CartCRUDRepository(BaseCRUDRepository):
         event_id: int,
     ) -> Cart:
         """Get active cart for user+event, or create a new one."""
+        # Read the clock once: the same instant decides expiry and stamps a new cart
+        now = datetime.datetime.now(datetime.timezone.utc)
+
         # First expire any old carts for this user+event
-        await self._expire_old_carts(user_id, event_id)
+        await self._expire_old_carts(user_id, event_id, now=now)
 
         # Look for existing active cart with eager-loaded items and event.
         stmt = (
@@ -52,17 +55,16 @@ class CartCRUDRepository(BaseCRUDRepository):
         result = await self.async_session.execute(stmt)
         cart = result.unique().scalar_one_or_none()
 
-        # Return the cart if it exists and has not expired.
-        if cart and not cart.is_expired:
-            return cart
+        if cart:
+            # Return the cart if it has not expired.
+            if not cart.is_expired_at(now):
+                return cart
 
-        # If expired, mark it and release any locked seats.
-        if cart and cart.is_expired:
+            # If expired, mark it and release any locked seats.
             cart.status = "expired"
             await self._release_cart_seats(cart)
 
         # Create new cart with a fresh expiry window.
-        now = datetime.datetime.now(datetime.timezone.utc)
         new_cart = Cart(
             user_id=user_id,
             event_id=event_id,
@@ -87,11 +89,13 @@ class CartCRUDRepository(BaseCRUDRepository):
     ) -> Cart:
         """Add an item to the cart, locking seats if applicable."""
         cart = await self._load_cart(cart_id)
+        # Read the clock once: the same instant decides expiry and the lock/expiry windows
+        now = datetime.datetime.now(datetime.timezone.utc)
 
         if not cart or cart.status != "active":
             raise ValueError("Cart is not active")
         # Check expiry and auto-expire if needed.
-        if cart.is_expired:
+        if cart.is_expired_at(now):
             cart.status = "expired"
             await self._release_cart_seats(cart)
             await self.async_session.commit()
@@ -122,7 +126,6 @@ class CartCRUDRepository(BaseCRUDRepository):
             raise ValueError(f"Only {category.available_seats} seats available in {category.name}")
 
         # Lock specific seats if assigned seating
-        now = datetime.datetime.now(datetime.timezone.utc)
         lock_until = now + datetime.timedelta(minutes=SEAT_LOCK_MINUTES)
         seat_ids = None
 
@@ -250,7 +253,7 @@ class CartCRUDRepository(BaseCRUDRepository):
             return False, ["Cart not found"], []
         if cart.status != "active":
             return False, ["Cart is not active"], []
-        if cart.is_expired:
+        if cart.is_expired_at(datetime.datetime.now(datetime.timezone.utc)):
             return False, ["Cart has expired"], []
         if not cart.items:
             return False, ["Cart is empty"], []
@@ -312,7 +315,7 @@ class CartCRUDRepository(BaseCRUDRepository):
         cart = result.unique().scalar_one_or_none()
 
         # Auto-expire and clean up if the cart has passed its expiry time.
-        if cart and cart.is_expired:
+        if cart and cart.is_expired_at(datetime.datetime.now(datetime.timezone.utc)):
             cart.status = "expired"
             await self._release_cart_seats(cart)
             await self.async_session.commit()
@@ -353,10 +356,10 @@ class CartCRUDRepository(BaseCRUDRepository):
         return result.unique().scalar_one_or_none()
 
     # Finds and expires all carts for a user+event that have passed their expiry time.
-    # Releases locked seats for each expired cart and flushes changes.
-    async def _expire_old_carts(self, user_id: int, event_id: int) -> None:
+    # Releases locked seats for each expired cart and flushes changes. `now` is the caller's
+    # clock reading, so this sweep and the caller's own expiry check agree on the instant.
+    async def _expire_old_carts(self, user_id: int, event_id: int, now: datetime.datetime) -> None:
         """Expire old active carts for this user+event."""
-        now = datetime.datetime.now(datetime.timezone.utc)
         stmt = (
             sqlalchemy.select(Cart)
             .options(joinedload(Cart.items))
@@ -377,20 +380,21 @@ class CartCRUDRepository(BaseCRUDRepository):
         if expired_carts:
             await self.async_session.flush()
 
-    # Iterates through all items in a cart and releases any locked seats back to AVAILABLE.
+    # Collects the seats of every item in a cart and releases any locked ones back to AVAILABLE.
     # Only releases seats that are currently in LOCKED status to avoid touching booked seats.
     async def _release_cart_seats(self, cart: Cart) -> None:
         """Release all locked seats in a cart."""
-        for item in cart.items:
-            if item.seat_ids:
-                for seat_id in item.seat_ids:
-                    seat_stmt = sqlalchemy.select(Seat).where(Seat.id == seat_id)
-                    seat_result = await self.async_session.execute(seat_stmt)
-                    seat = seat_result.scalar_one_or_none()
-                    if seat and seat.status == SeatStatus.LOCKED.value:
-                        seat.status = SeatStatus.AVAILABLE.value
-                        seat.locked_until = None
-                        seat.locked_by = None
+        seat_ids = [seat_id for item in cart.items for seat_id in item.seat_ids or []]
+        if not seat_ids:
+            return
+
+        # One UPDATE for every seat in the cart rather than a SELECT per seat
+        stmt = (
+            sqlalchemy.update(Seat)
+            .where(Seat.id.in_(seat_ids), Seat.status == SeatStatus.LOCKED.value)
+            .values(status=SeatStatus.AVAILABLE.value, locked_until=None, locked_by=None)
+        )
+        await self.async_session.execute(stmt)
 
     # Allows a user to explicitly abandon their cart, releasing all locked seats
     # and marking the cart as "abandoned" (distinct from "expired").
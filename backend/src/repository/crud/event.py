@@ -6,7 +6,7 @@ import datetime
 import typing
 
 import sqlalchemy
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.sql import functions as sqlalchemy_functions
 from sqlalchemy import func
 from slugify import slugify
@@ -127,8 +127,9 @@ class EventCRUDRepository(BaseCRUDRepository):
         """Get events with pagination and filtering"""
         stmt = sqlalchemy.select(Event)
 
+        # Venues for the page are fetched with one SELECT IN rather than joined onto every row
         if include_venue:
-            stmt = stmt.options(joinedload(Event.venue))
+            stmt = stmt.options(selectinload(Event.venue))
 
         # Apply filters
         # published_only takes precedence over raw status filter.
@@ -148,11 +149,11 @@ class EventCRUDRepository(BaseCRUDRepository):
 
         # Full-text search with ILIKE fallback
         # Combines PostgreSQL tsvector full-text search with ILIKE patterns so results
-        # are returned even when the search_vector column is null or for partial matches.
+        # are returned for partial-word matches that the stemmed tsquery does not catch.
         if search:
             search_pattern = f"%{search}%"
             # Use OR to combine full-text search with ILIKE fallback
-            # This handles cases where search_vector is null or partial word matches
+            # This handles partial word matches
             search_query = func.plainto_tsquery('english', search)
             stmt = stmt.where(
                 sqlalchemy.or_(
@@ -206,7 +207,7 @@ class EventCRUDRepository(BaseCRUDRepository):
         now = datetime.datetime.now(datetime.timezone.utc)
         stmt = (
             sqlalchemy.select(Event)
-            .options(joinedload(Event.venue))
+            .options(selectinload(Event.venue))
             .where(Event.status == EventStatus.PUBLISHED.value)
             .where(Event.event_date > now)
         )
@@ -7,12 +7,13 @@ from sqlalchemy.sql import functions as sqlalchemy_functions
 
 from src.models.db.otp import OTPCode, OTPPurpose
 from src.repository.crud.base import BaseCRUDRepository
+from src.securities.hashing.otp import otp_hasher
 from src.utilities.exceptions.database import EntityDoesNotExist
 
 
 class OTPCRUDRepository(BaseCRUDRepository):
     # Creates a new OTP record in the database with the given code, purpose, and expiration
-    # Can be linked to a user_id, phone number, or email address
+    # Can be linked to a user_id, phone number, or email address. Only the code's hash is stored
     async def create_otp(
         self,
         code: str,
@@ -27,7 +28,7 @@ class OTPCRUDRepository(BaseCRUDRepository):
             user_id=user_id,
             phone=phone,
             email=email,
-            code=code,
+            code=otp_hasher.hash_code(code),
             purpose=purpose,
             expires_at=expires_at,
         )
@@ -38,7 +39,56 @@ class OTPCRUDRepository(BaseCRUDRepository):
 
         return new_otp
 
-    # Retrieves a valid OTP that matches the code, purpose, and contact method (phone/email)
+    # Invalidates previous unused OTPs for the same purpose/contact and inserts the new one
+    # in a single statement: the UPDATE runs as a data-modifying CTE attached to the INSERT,
+    # so rotating a code costs one round-trip and one commit instead of two of each
+    async def rotate_otp(
+        self,
+        code: str,
+        purpose: str,
+        expires_at: datetime.datetime,
+        user_id: int | None = None,
+        phone: str | None = None,
+        email: str | None = None,
+    ) -> OTPCode:
+        """Invalidate previous OTPs and create a new one in one round-trip"""
+        invalidate_stmt = (
+            sqlalchemy.update(OTPCode)
+            .where(
+                OTPCode.purpose == purpose,
+                OTPCode.is_used == False,
+            )
+            .values(is_used=True)
+        )
+
+        if phone:
+            invalidate_stmt = invalidate_stmt.where(OTPCode.phone == phone)
+        if email:
+            invalidate_stmt = invalidate_stmt.where(OTPCode.email == email)
+
+        invalidated = invalidate_stmt.returning(OTPCode.id).cte(name="invalidated_otps")
+
+        stmt = (
+            sqlalchemy.insert(OTPCode)
+            .add_cte(invalidated)
+            .values(
+                user_id=user_id,
+                phone=phone,
+                email=email,
+                code=otp_hasher.hash_code(code),
+                purpose=purpose,
+                expires_at=expires_at,
+                is_used=False,
+            )
+            .returning(OTPCode)
+        )
+        query = await self.async_session.execute(statement=stmt)
+        new_otp = query.scalar_one()
+        await self.async_session.commit()
+
+        return new_otp
+
+    # Retrieves a valid OTP that matches the code (by hash), purpose, and contact method (phone/email)
     # Only returns OTPs that have not been used and have not expired
     # Orders by newest first to get the most recent matching OTP
     async def get_valid_otp(
@@ -52,7 +102,7 @@ class OTPCRUDRepository(BaseCRUDRepository):
         now = datetime.datetime.now(datetime.timezone.utc)
 
         stmt = sqlalchemy.select(OTPCode).where(
-            OTPCode.code == code,
+            OTPCode.code == otp_hasher.hash_code(code),
             OTPCode.purpose == purpose,
             OTPCode.is_used == False,
             OTPCode.expires_at > now,
@@ -64,8 +114,8 @@ class OTPCRUDRepository(BaseCRUDRepository):
         if email:
             stmt = stmt.where(OTPCode.email == email)
 
-        # Get the most recently created matching OTP
-        stmt = stmt.order_by(OTPCode.created_at.desc())
+        # Get the most recently created matching OTP; served by the partial lookup indexes
+        stmt = stmt.order_by(OTPCode.created_at.desc()).limit(1)
 
         query = await self.async_session.execute(statement=stmt)
         return query.scalar()
@@ -111,8 +161,7 @@ class OTPCRUDRepository(BaseCRUDRepository):
     # Returns the number of deleted rows
     async def cleanup_expired_otps(self) -> int:
         """Delete expired OTP codes (cleanup task)"""
-        now = datetime.datetime.now(datetime.timezone.utc)
-        stmt = sqlalchemy.delete(OTPCode).where(OTPCode.expires_at < now)
+        stmt = sqlalchemy.delete(OTPCode).where(OTPCode.is_expired)
         result = await self.async_session.execute(statement=stmt)
         await self.async_session.commit()
         return result.rowcount  # type: ignore
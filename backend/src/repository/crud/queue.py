@@ -8,8 +8,10 @@ import typing
 from uuid import UUID
 
 import sqlalchemy
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql import functions as sqlalchemy_functions
 
+from src.models.db.event import Event
 from src.models.db.queue_entry import QueueEntry, QueueStatus
 from src.repository.crud.base import BaseCRUDRepository
 from src.utilities.exceptions.database import EntityDoesNotExist
@@ -126,6 +128,59 @@ class QueueCRUDRepository(BaseCRUDRepository):
 
         return entry, ahead_count
 
+    # Builds the position snapshot query for an event: each active entry, the number of
+    # active entries ahead of it (correlated count), and the event's batch settings for
+    # the wait estimate. Callers narrow it down to the users they need.
+    @staticmethod
+    def _position_snapshot_stmt(event_id: int) -> sqlalchemy.Select:
+        ahead = aliased(QueueEntry)
+        ahead_count = (
+            sqlalchemy.select(sqlalchemy.func.count())
+            .select_from(ahead)
+            .where(ahead.event_id == QueueEntry.event_id)
+            .where(ahead.position < QueueEntry.position)
+            .where(ahead.status.in_([
+                QueueStatus.WAITING.value,
+                QueueStatus.PROCESSING.value
+            ]))
+            .scalar_subquery()
+        )
+
+        return (
+            sqlalchemy.select(
+                QueueEntry.id,
+                QueueEntry.user_id,
+                QueueEntry.position,
+                QueueEntry.status,
+                QueueEntry.expires_at,
+                ahead_count.label("total_ahead"),
+                Event.queue_batch_size,
+                Event.queue_processing_minutes,
+            )
+            .join(Event, Event.id == QueueEntry.event_id)
+            .where(QueueEntry.event_id == event_id)
+            .where(QueueEntry.status.in_([
+                QueueStatus.WAITING.value,
+                QueueStatus.PROCESSING.value
+            ]))
+        )
+
+    # Returns everything a position update needs in a single round-trip.
+    # Returns None if the user is not in the queue.
+    async def get_position_snapshot(self, event_id: int, user_id: int) -> sqlalchemy.RowMapping | None:
+        """Get user's queue entry, people ahead and event batch settings in one query"""
+        stmt = self._position_snapshot_stmt(event_id=event_id).where(QueueEntry.user_id == user_id).limit(1)
+        result = await self.async_session.execute(statement=stmt)
+        return result.mappings().first()
+
+    # Bulk variant of the position snapshot query: one statement for many users of the same
+    # event (users not in the queue are simply absent from its rows). Exposed as a statement
+    # so hot paths can run it on a bare connection without an ORM session.
+    @classmethod
+    def position_snapshots_stmt(cls, event_id: int, user_ids: typing.Sequence[int]) -> sqlalchemy.Select:
+        """Build the position snapshot query for several users of an event"""
+        return cls._position_snapshot_stmt(event_id=event_id).where(QueueEntry.user_id.in_(user_ids))
+
     # Allows a user to voluntarily leave the queue by marking their entry as LEFT.
     # Returns False if no active entry was found.
     async def leave_queue(self, event_id: int, user_id: int) -> bool:
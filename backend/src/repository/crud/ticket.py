@@ -12,6 +12,7 @@ from sqlalchemy.orm import joinedload
 from src.models.db.booking import Booking, BookingItem
 from src.models.db.ticket_transfer import TicketTransfer
 from src.models.db.account import Account
+from src.repository.crud.account import email_match_order
 from src.repository.crud.base import BaseCRUDRepository
 from src.utilities.exceptions.database import EntityDoesNotExist
 
@@ -121,9 +122,14 @@ class TicketCRUDRepository(BaseCRUDRepository):
             raise ValueError("There's already a pending transfer for this ticket")
 
         # Check if recipient exists in the system (may be None for non-registered users).
-        stmt = sqlalchemy.select(Account).where(Account.email == to_email)
+        stmt = (
+            sqlalchemy.select(Account)
+            .where(sqlalchemy.func.lower(Account.email) == to_email.lower())
+            .order_by(*email_match_order(to_email))
+            .limit(1)
+        )
         result = await self.async_session.execute(stmt)
-        to_user = result.scalar_one_or_none()
+        to_user = result.scalars().first()
 
         # Generate transfer token -- cryptographically secure URL-safe string.
         transfer_token = secrets.token_urlsafe(32)
@@ -67,9 +67,9 @@ class WishlistCRUDRepository(BaseCRUDRepository):
         )
         self.async_session.add(instance=wishlist_item)
         await self.async_session.commit()
-        await self.async_session.refresh(instance=wishlist_item)
 
-        # Load the event relationship for the response.
+        # Load the item with its event and venue for the response in one joined query
+        # (this also picks up the server-generated created_at, so no separate refresh).
         stmt = (
             sqlalchemy.select(Wishlist)
             .options(joinedload(Wishlist.event).joinedload(Event.venue))
@@ -111,13 +111,20 @@ class WishlistCRUDRepository(BaseCRUDRepository):
         result = await self.async_session.execute(statement=stmt)
         return result.scalar()
 
-    # Boolean convenience method to check if an event is in a user's wishlist.
-    # Delegates to get_wishlist_item and converts the result to a boolean.
+    # Boolean check whether an event is in a user's wishlist.
+    # Runs SELECT EXISTS against the (account_id, event_id) unique index, so no row is
+    # fetched or turned into an ORM object.
     async def is_in_wishlist(
         self,
         account_id: int,
         event_id: int,
     ) -> bool:
         """Check if an event is in user's wishlist"""
-        item = await self.get_wishlist_item(account_id, event_id)
-        return item is not None
+        stmt = sqlalchemy.select(
+            sqlalchemy.exists().where(
+                Wishlist.account_id == account_id,
+                Wishlist.event_id == event_id,
+            )
+        )
+        result = await self.async_session.execute(statement=stmt)
+        return bool(result.scalar())
@@ -1,6 +1,7 @@
 # Database connection module -- configures and initializes the async PostgreSQL engine,
 # session factory, and connection pool using SQLAlchemy's asyncpg driver.
 
+import uuid
 from urllib.parse import quote_plus
 
 from sqlalchemy.ext.asyncio import (
@@ -20,12 +21,11 @@ class AsyncDatabase:
         # Build the PostgreSQL connection URI from settings, URL-encoding username and password
         # to handle special characters safely.
         self.postgres_uri: str = f"{settings.DB_POSTGRES_SCHEMA}://{quote_plus(settings.DB_POSTGRES_USERNAME)}:{quote_plus(settings.DB_POSTGRES_PASSWORD)}@{settings.DB_POSTGRES_HOST}:{settings.DB_POSTGRES_PORT}/{settings.DB_POSTGRES_NAME}"
-        # Create the async engine with configurable echo logging, pool size, and overflow limits.
+        # Create the async engine with configurable echo logging and pool settings.
         self.async_engine: SQLAlchemyAsyncEngine = create_sqlalchemy_async_engine(
             url=self.set_async_db_uri,
             echo=settings.IS_DB_ECHO_LOG,
-            pool_size=settings.DB_POOL_SIZE,
-            max_overflow=settings.DB_POOL_OVERFLOW,
+            **self.set_pool_options,
         )
         # Use session factory instead of single session instance
         # expire_on_commit=False prevents lazy-load issues after commit in async context.
@@ -40,6 +40,41 @@ class AsyncDatabase:
         # Expose the underlying connection pool for monitoring or introspection.
         self.pool: SQLAlchemyPool = self.async_engine.pool
 
+    @property
+    def set_pool_options(self) -> dict:
+        """
+        Pool and driver keyword arguments for the engine:
+
+            behind PgBouncer => `NullPool` (PgBouncer owns the pooling), no prepared statement cache
+            otherwise        => queue pool sized by `DB_POOL_SIZE` + `DB_POOL_OVERFLOW`
+        """
+        if settings.IS_DB_BEHIND_PGBOUNCER:
+            # A transaction-mode PgBouncer hands each transaction a different server connection,
+            # so cached or fixed-name prepared statements would collide ("already exists" / "does
+            # not exist"). Disable the cache and give every statement a unique name regardless
+            # of DB_STATEMENT_CACHE_SIZE.
+            return {
+                "poolclass": NullPool,
+                "connect_args": {
+                    "prepared_statement_cache_size": 0,
+                    "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+                },
+            }
+
+        # Fail fast with a timeout instead of waiting indefinitely for a free connection, and
+        # recycle/ping connections so ones dropped by the server or a proxy never reach a
+        # long-lived WebSocket handler as a spurious error. asyncpg prepares every statement;
+        # caching them per connection skips the parse/plan round-trip on repeated hot-path
+        # queries (queue position, token lookup).
+        return {
+            "connect_args": {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE},
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_POOL_OVERFLOW,
+            "pool_timeout": settings.DB_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+            "pool_pre_ping": settings.IS_DB_POOL_PRE_PING,
+        }
+
     @property
     def set_async_db_uri(self) -> str:
         """
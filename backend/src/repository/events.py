@@ -26,6 +26,15 @@ async def async_db_session():
         await session.close()
 
 
+# Async context manager that checks out a bare Core connection from the pool, for hot
+# read paths that run a single prebuilt statement and need no ORM session state.
+@asynccontextmanager
+async def async_db_connection():
+    """Context manager for borrowing a pooled async database connection."""
+    async with async_db.async_engine.connect() as connection:
+        yield connection
+
+
 # SQLAlchemy event listener that fires when a new raw DB-API connection is established.
 # Logs connection details for debugging and monitoring pool behavior.
 @event.listens_for(target=async_db.async_engine.sync_engine, identifier="connect")
@@ -0,0 +1,38 @@
+"""Add partial lookup indexes for active OTP codes
+
+Revision ID: otp_active_lookup_indexes
+Revises: add_wishlist_table
+Create Date: 2026-10-16 00:01:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'otp_active_lookup_indexes'
+down_revision = 'add_wishlist_table'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_otp_code_active_email_lookup',
+        'otp_code',
+        ['purpose', 'email', 'code'],
+        unique=False,
+        postgresql_where=sa.text('is_used = false'),
+    )
+    op.create_index(
+        'ix_otp_code_active_phone_lookup',
+        'otp_code',
+        ['purpose', 'phone', 'code'],
+        unique=False,
+        postgresql_where=sa.text('is_used = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_otp_code_active_phone_lookup', table_name='otp_code')
+    op.drop_index('ix_otp_code_active_email_lookup', table_name='otp_code')
@@ -0,0 +1,51 @@
+"""Index admin activity log by admin and newest entry first
+
+Revision ID: admin_log_admin_created_index
+Revises: otp_active_lookup_indexes
+Create Date: 2026-10-16 01:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'admin_log_admin_created_index'
+down_revision = 'otp_active_lookup_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built CONCURRENTLY so audit-log inserts are not blocked while the index is created;
+    # that cannot run inside a transaction, hence the autocommit block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_admin_activity_log_admin_created',
+            'admin_activity_log',
+            ['admin_id', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # Every lookup by admin_id is served by the new index's leading column
+        op.drop_index(
+            'ix_admin_activity_log_admin_id',
+            table_name='admin_activity_log',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_admin_activity_log_admin_id',
+            'admin_activity_log',
+            ['admin_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_admin_activity_log_admin_created',
+            table_name='admin_activity_log',
+            postgresql_concurrently=True,
+        )
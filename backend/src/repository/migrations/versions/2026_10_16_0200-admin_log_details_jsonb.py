@@ -0,0 +1,39 @@
+"""Store admin activity log details as JSONB
+
+Revision ID: admin_log_details_jsonb
+Revises: admin_log_admin_created_index
+Create Date: 2026-10-16 02:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision = 'admin_log_details_jsonb'
+down_revision = 'admin_log_admin_created_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'admin_activity_log',
+        'details',
+        type_=JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using='details::jsonb',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'admin_activity_log',
+        'details',
+        type_=sa.JSON(),
+        existing_type=JSONB(),
+        existing_nullable=True,
+        postgresql_using='details::json',
+    )
@@ -0,0 +1,50 @@
+"""Size account password hash and salt columns to their hash formats
+
+Revision ID: account_password_column_sizes
+Revises: admin_log_details_jsonb
+Create Date: 2026-10-16 03:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'account_password_column_sizes'
+down_revision = 'admin_log_details_jsonb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'account',
+        '_hashed_password',
+        type_=sa.String(length=255),
+        existing_type=sa.String(length=1024),
+        existing_nullable=True,
+    )
+    op.alter_column(
+        'account',
+        '_hash_salt',
+        type_=sa.String(length=60),
+        existing_type=sa.String(length=1024),
+        existing_nullable=True,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'account',
+        '_hash_salt',
+        type_=sa.String(length=1024),
+        existing_type=sa.String(length=60),
+        existing_nullable=True,
+    )
+    op.alter_column(
+        'account',
+        '_hashed_password',
+        type_=sa.String(length=1024),
+        existing_type=sa.String(length=255),
+        existing_nullable=True,
+    )
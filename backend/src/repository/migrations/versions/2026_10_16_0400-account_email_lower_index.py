@@ -0,0 +1,33 @@
+"""Add case-insensitive lookup index on account email
+
+Revision ID: account_email_lower_index
+Revises: account_password_column_sizes
+Create Date: 2026-10-16 04:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'account_email_lower_index'
+down_revision = 'account_password_column_sizes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built CONCURRENTLY so signups and logins are not blocked while the index is created
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_account_email_lower',
+            'account',
+            [sa.text('lower(email)')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_account_email_lower', table_name='account', postgresql_concurrently=True)
@@ -0,0 +1,31 @@
+"""Index account creation time for admin listings and signup stats
+
+Revision ID: account_created_at_index
+Revises: account_email_lower_index
+Create Date: 2026-10-16 05:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'account_created_at_index'
+down_revision = 'account_email_lower_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_account_created_at',
+            'account',
+            ['created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_account_created_at', table_name='account', postgresql_concurrently=True)
@@ -0,0 +1,47 @@
+"""Replace cart expiry and booking event indexes with predicate-matching ones
+
+Revision ID: cart_booking_partial_indexes
+Revises: account_created_at_index
+Create Date: 2026-10-16 06:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'cart_booking_partial_indexes'
+down_revision = 'account_created_at_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_cart_active_expiry',
+            'cart',
+            ['expires_at'],
+            unique=False,
+            postgresql_where=sa.text("status = 'active'"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_cart_expires', table_name='cart', postgresql_concurrently=True)
+
+        op.create_index(
+            'ix_booking_event_status',
+            'booking',
+            ['event_id', 'status', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_booking_event', table_name='booking', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_booking_event', 'booking', ['event_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_booking_event_status', table_name='booking', postgresql_concurrently=True)
+
+        op.create_index('ix_cart_expires', 'cart', ['expires_at'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_cart_active_expiry', table_name='cart', postgresql_concurrently=True)
@@ -0,0 +1,43 @@
+"""Store cart item seat IDs as an integer array
+
+Revision ID: cart_item_seat_ids_array
+Revises: cart_booking_partial_indexes
+Create Date: 2026-10-16 07:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY
+
+
+# revision identifiers, used by Alembic.
+revision = 'cart_item_seat_ids_array'
+down_revision = 'cart_booking_partial_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # ALTER ... USING cannot take a subquery, so the array is filled through a new column.
+    # General-admission items hold SQL NULL or a JSON null; both become SQL NULL.
+    op.add_column('cart_item', sa.Column('seat_ids_array', ARRAY(sa.Integer()), nullable=True))
+    op.execute(
+        """
+        UPDATE cart_item
+        SET seat_ids_array = ARRAY(SELECT json_array_elements_text(seat_ids)::integer)
+        WHERE json_typeof(seat_ids) = 'array'
+        """
+    )
+    op.drop_column('cart_item', 'seat_ids')
+    op.alter_column('cart_item', 'seat_ids_array', new_column_name='seat_ids')
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'cart_item',
+        'seat_ids',
+        type_=sa.JSON(),
+        existing_type=ARRAY(sa.Integer()),
+        existing_nullable=True,
+        postgresql_using='to_json(seat_ids)',
+    )
@@ -0,0 +1,29 @@
+"""Cache sequence values for the checkout tables
+
+Revision ID: cached_checkout_sequences
+Revises: cart_item_seat_ids_array
+Create Date: 2026-10-16 08:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'cached_checkout_sequences'
+down_revision = 'cart_item_seat_ids_array'
+branch_labels = None
+depends_on = None
+
+
+# Tables written on every checkout; each one's SERIAL id is backed by `<table>_id_seq`
+CHECKOUT_TABLES = ('booking', 'booking_item', 'cart', 'cart_item')
+
+
+def upgrade() -> None:
+    for table in CHECKOUT_TABLES:
+        op.execute(f"ALTER SEQUENCE {table}_id_seq CACHE 100")
+
+
+def downgrade() -> None:
+    for table in CHECKOUT_TABLES:
+        op.execute(f"ALTER SEQUENCE {table}_id_seq CACHE 1")
@@ -0,0 +1,32 @@
+"""Drop indexes duplicating the booking and ticket number unique constraints
+
+Revision ID: drop_dup_booking_number_indexes
+Revises: cached_checkout_sequences
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'drop_dup_booking_number_indexes'
+down_revision = 'cached_checkout_sequences'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Lookups by number keep using the unique constraints' own indexes
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_booking_item_ticket', table_name='booking_item', postgresql_concurrently=True)
+        op.drop_index('ix_booking_number', table_name='booking', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_booking_number', 'booking', ['booking_number'], unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_booking_item_ticket', 'booking_item', ['ticket_number'], unique=False, postgresql_concurrently=True
+        )
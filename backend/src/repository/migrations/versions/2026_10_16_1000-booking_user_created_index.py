@@ -0,0 +1,35 @@
+"""Index bookings by user and newest first
+
+Revision ID: booking_user_created_index
+Revises: drop_dup_booking_number_indexes
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'booking_user_created_index'
+down_revision = 'drop_dup_booking_number_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_booking_user_created',
+            'booking',
+            ['user_id', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # Lookups by user_id alone are served by the new index's leading column
+        op.drop_index('ix_booking_user', table_name='booking', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_booking_user', 'booking', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_booking_user_created', table_name='booking', postgresql_concurrently=True)
@@ -0,0 +1,69 @@
+"""Compute event search_vector as a generated column
+
+Revision ID: event_search_vector_generated
+Revises: booking_user_created_index
+Create Date: 2026-10-16 11:00:00.000000
+
+Replaces the trigger that maintained event.search_vector with a stored generated column
+using the same weighted expression, and rebuilds its GIN index.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+
+# revision identifiers, used by Alembic.
+revision = 'event_search_vector_generated'
+down_revision = 'booking_user_created_index'
+branch_labels = None
+depends_on = None
+
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(short_description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(organizer_name, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS event_search_vector_trigger ON event")
+    op.execute("DROP FUNCTION IF EXISTS event_search_vector_update()")
+
+    # An existing column cannot be turned into a generated one, so it is replaced
+    op.execute("DROP INDEX IF EXISTS ix_event_search_vector")
+    op.drop_column('event', 'search_vector')
+    op.add_column(
+        'event',
+        sa.Column('search_vector', TSVECTOR, sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True), nullable=True),
+    )
+    op.execute("CREATE INDEX ix_event_search_vector ON event USING GIN (search_vector)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_event_search_vector")
+    op.drop_column('event', 'search_vector')
+    op.add_column('event', sa.Column('search_vector', TSVECTOR, nullable=True))
+    op.execute("CREATE INDEX ix_event_search_vector ON event USING GIN (search_vector)")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION event_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('english', COALESCE(NEW.title, '')), 'A') ||
+                setweight(to_tsvector('english', COALESCE(NEW.short_description, '')), 'B') ||
+                setweight(to_tsvector('english', COALESCE(NEW.organizer_name, '')), 'B') ||
+                setweight(to_tsvector('english', COALESCE(NEW.description, '')), 'C');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER event_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, short_description, description, organizer_name
+        ON event
+        FOR EACH ROW
+        EXECUTE FUNCTION event_search_vector_update();
+    """)
+    op.execute(f"UPDATE event SET search_vector = {SEARCH_VECTOR_EXPRESSION}")
@@ -0,0 +1,34 @@
+"""Index events by status and event date
+
+Revision ID: event_status_date_index
+Revises: event_search_vector_generated
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'event_status_date_index'
+down_revision = 'event_search_vector_generated'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_event_status_date',
+            'event',
+            ['status', 'event_date'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # Status-only filters are served by the new index's leading column
+        op.drop_index('ix_event_status', table_name='event', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_event_status', 'event', ['status'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_event_status_date', table_name='event', postgresql_concurrently=True)
@@ -0,0 +1,32 @@
+"""Index the event created_by foreign key
+
+Revision ID: event_created_by_index
+Revises: event_status_date_index
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'event_created_by_index'
+down_revision = 'event_status_date_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # venue_id is already indexed (ix_event_venue_id, phase2 migration)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_event_created_by',
+            'event',
+            ['created_by'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_event_created_by', table_name='event', postgresql_concurrently=True)
@@ -0,0 +1,42 @@
+"""Store OTP codes as keyed hashes
+
+Revision ID: otp_code_hashed
+Revises: event_created_by_index
+Create Date: 2026-10-16 14:00:00.000000
+
+Outstanding plaintext codes cannot be hashed here (the key lives in application settings),
+so they are deleted; they expire within minutes and users simply request a new code.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'otp_code_hashed'
+down_revision = 'event_created_by_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DELETE FROM otp_code")
+    op.alter_column(
+        'otp_code',
+        'code',
+        existing_type=sa.String(length=10),
+        type_=sa.LargeBinary(length=32),
+        existing_nullable=False,
+        postgresql_using='code::bytea',
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM otp_code")
+    op.alter_column(
+        'otp_code',
+        'code',
+        existing_type=sa.LargeBinary(length=32),
+        type_=sa.String(length=10),
+        existing_nullable=False,
+        postgresql_using="encode(code, 'hex')",
+    )
@@ -0,0 +1,39 @@
+"""Store event extra data as JSONB
+
+Revision ID: event_extra_data_jsonb
+Revises: otp_code_hashed
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision = 'event_extra_data_jsonb'
+down_revision = 'otp_code_hashed'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'event',
+        'extra_data',
+        type_=JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using='extra_data::jsonb',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'event',
+        'extra_data',
+        type_=sa.JSON(),
+        existing_type=JSONB(),
+        existing_nullable=True,
+        postgresql_using='extra_data::json',
+    )
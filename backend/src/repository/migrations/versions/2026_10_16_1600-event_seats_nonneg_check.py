@@ -0,0 +1,25 @@
+"""Reject negative event seat counts
+
+Revision ID: event_seats_nonneg_check
+Revises: event_extra_data_jsonb
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'event_seats_nonneg_check'
+down_revision = 'event_extra_data_jsonb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Unguarded decrements could have driven counts below zero; clamp them so the check holds
+    op.execute("UPDATE event SET available_seats = 0 WHERE available_seats < 0")
+    op.create_check_constraint('ck_event_seats_nonneg', 'event', 'available_seats >= 0')
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_event_seats_nonneg', 'event', type_='check')
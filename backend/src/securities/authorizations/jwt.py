@@ -12,13 +12,14 @@ from src.utilities.exceptions.database import EntityDoesNotExist
 # Handles JWT token generation and decoding for user authentication
 class JWTGenerator:
     def __init__(self):
-        pass
+        # Accepted signing algorithms, built once rather than on every decode
+        self.algorithms: list[str] = [settings.JWT_ALGORITHM]
 
     # Internal method to create a signed JWT token with an expiry time
     def _generate_jwt_token(
         self,
         *,
-        jwt_data: dict[str, str],
+        jwt_data: dict[str, str | int | None],
         expires_delta: datetime.timedelta | None = None,
     ) -> str:
         to_encode = jwt_data.copy()
@@ -48,15 +49,26 @@ class JWTGenerator:
                 username=account.username,
                 email=account.email,
                 role=account.role,
+                user_id=account.id,
             ).dict(),  # type: ignore
             expires_delta=datetime.timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRATION_TIME),
         )
 
+    # Decode and verify a JWT token, returning its raw claims (including `exp`)
+    def retrieve_claims_from_token(self, token: str, secret_key: str) -> dict:
+        try:
+            return jose_jwt.decode(token=token, key=secret_key, algorithms=self.algorithms)
+
+        except JoseJWTError as token_decode_error:
+            # Token is malformed, expired, or has an invalid signature
+            raise ValueError("Unable to decode JWT Token") from token_decode_error
+
     # Decode a JWT token and extract the username and email from its payload
     def retrieve_details_from_token(self, token: str, secret_key: str) -> list[str]:
+        # Decode and verify the token signature and expiry
+        payload = self.retrieve_claims_from_token(token=token, secret_key=secret_key)
+
         try:
-            # Decode and verify the token signature and expiry
-            payload = jose_jwt.decode(token=token, key=secret_key, algorithms=[settings.JWT_ALGORITHM])
             # Parse the payload into a structured JWTAccount object
             jwt_account = JWTAccount(
                 username=payload["username"],
@@ -64,10 +76,6 @@ class JWTGenerator:
                 role=payload.get("role", "user"),
             )
 
-        except JoseJWTError as token_decode_error:
-            # Token is malformed, expired, or has an invalid signature
-            raise ValueError("Unable to decode JWT Token") from token_decode_error
-
         except pydantic.ValidationError as validation_error:
             # Token payload does not match the expected schema
             raise ValueError("Invalid payload in token") from validation_error
@@ -75,6 +83,24 @@ class JWTGenerator:
         # Return username and email extracted from the token
         return [jwt_account.username, jwt_account.email]
 
+    # Decode a JWT token and extract the account ID and username from its payload.
+    # The ID is None for tokens issued before the `user_id` claim was introduced.
+    def retrieve_identity_from_token(self, token: str, secret_key: str) -> tuple[int | None, str]:
+        payload = self.retrieve_claims_from_token(token=token, secret_key=secret_key)
+
+        try:
+            jwt_account = JWTAccount(
+                username=payload["username"],
+                email=payload["email"],
+                role=payload.get("role", "user"),
+                user_id=payload.get("user_id"),
+            )
+
+        except (KeyError, pydantic.ValidationError) as validation_error:
+            raise ValueError("Invalid payload in token") from validation_error
+
+        return jwt_account.user_id, jwt_account.username
+
 
 # Factory function to create a new JWTGenerator instance
 def get_jwt_generator() -> JWTGenerator:
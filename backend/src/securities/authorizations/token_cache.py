@@ -0,0 +1,87 @@
+import hashlib
+import time
+
+from src.config.manager import settings
+
+
+# In-process cache mapping a validated JWT to the account it identifies.
+# Entries live for the token's remaining lifetime, capped at `max_ttl_seconds` when given,
+# so a warm token skips both the decode and the account lookup. Keys are hashes of the
+# token, never the raw token.
+class JWTUserCache:
+    # Upper bound on cached tokens; expired entries are pruned once this is exceeded
+    MAX_ENTRIES = 10_000
+
+    def __init__(self, max_ttl_seconds: float | None = None):
+        self.max_ttl_seconds = max_ttl_seconds
+        # key -> (user_id, is_blocked, monotonic expiry)
+        self._entries: dict[str, tuple[int, bool, float]] = {}
+        # user_id -> cache keys, so every token of a user can be dropped at once
+        self._keys_by_user: dict[int, set[str]] = {}
+
+    # Derive the cache key from the token so raw tokens are never held in memory
+    @staticmethod
+    def _build_key(token: str) -> str:
+        return "jwt:" + hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+    # Return the cached (user_id, is_blocked) pair, or None on a miss or an expired entry
+    def get(self, token: str) -> tuple[int, bool] | None:
+        key = self._build_key(token)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        user_id, is_blocked, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._discard(key=key, user_id=user_id)
+            return None
+
+        return user_id, is_blocked
+
+    # Cache the account resolved from a token until the token's `exp` claim (or the TTL cap)
+    def set(self, token: str, user_id: int, is_blocked: bool, exp: int | float) -> None:
+        ttl = exp - time.time()
+        if self.max_ttl_seconds is not None:
+            ttl = min(ttl, self.max_ttl_seconds)
+        if ttl <= 0:
+            return
+
+        if len(self._entries) >= self.MAX_ENTRIES:
+            self._prune_expired()
+        # Still full: evict the oldest entry (dicts preserve insertion order)
+        if len(self._entries) >= self.MAX_ENTRIES:
+            oldest_key = next(iter(self._entries))
+            self._discard(key=oldest_key, user_id=self._entries[oldest_key][0])
+
+        key = self._build_key(token)
+        self._entries[key] = (user_id, is_blocked, time.monotonic() + ttl)
+        self._keys_by_user.setdefault(user_id, set()).add(key)
+
+    # Drop every cached token of a user (e.g. after the account is blocked, deleted or its password changes)
+    def invalidate_user(self, user_id: int) -> None:
+        for key in self._keys_by_user.pop(user_id, set()):
+            self._entries.pop(key, None)
+
+    def _discard(self, key: str, user_id: int) -> None:
+        self._entries.pop(key, None)
+        user_keys = self._keys_by_user.get(user_id)
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._keys_by_user[user_id]
+
+    def _prune_expired(self) -> None:
+        now = time.monotonic()
+        for key, (user_id, _, expires_at) in list(self._entries.items()):
+            if expires_at <= now:
+                self._discard(key=key, user_id=user_id)
+
+
+# Factory function to create a new JWTUserCache instance
+def get_jwt_user_cache() -> JWTUserCache:
+    return JWTUserCache(max_ttl_seconds=settings.JWT_USER_CACHE_TTL_SECONDS)
+
+
+# Module-level singleton instance — shared across the application for token lookups
+jwt_user_cache: JWTUserCache = get_jwt_user_cache()
@@ -0,0 +1,24 @@
+import hashlib
+import hmac
+
+from src.config.manager import settings
+
+
+# Derives the stored form of a one-time password: an HMAC-SHA256 keyed with the server-side
+# hashing salt, so a leaked otp_code table does not reveal codes that are still valid
+class OTPHasher:
+    def __init__(self):
+        self._key: bytes = settings.HASHING_SALT.encode()
+
+    # Return the 32-byte digest stored in (and compared against) the otp_code table
+    def hash_code(self, code: str) -> bytes:
+        return hmac.new(self._key, code.encode(), digestmod=hashlib.sha256).digest()
+
+
+# Factory function to create a new OTPHasher instance
+def get_otp_hasher() -> OTPHasher:
+    return OTPHasher()
+
+
+# Module-level singleton instance — shared across the application for OTP hashing
+otp_hasher: OTPHasher = get_otp_hasher()
@@ -17,7 +17,6 @@ import asyncio
 import os
 import sys
 
-import decouple
 from loguru import logger
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
@@ -26,7 +25,8 @@ from sqlalchemy.orm import sessionmaker
 # Add parent directory to path for imports when running as a standalone script
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-import src.models.db  # noqa: F401 — import all models so relationships resolve
+from src.models.db import resolve_all as resolve_all_models
+from src.config.manager import settings
 from src.models.db.account import Account, UserRole
 from src.securities.hashing.password import pwd_generator
 from src.repository.database import async_db
@@ -36,10 +36,10 @@ from src.repository.database import async_db
 async def create_admin_user(async_session: AsyncSession) -> Account | None:
     """Create the initial admin user if it doesn't exist"""
 
-    # Read admin credentials from environment variables with sensible defaults
-    admin_email = decouple.config("ADMIN_EMAIL", default="admin@zoniq.com", cast=str)
-    admin_password = decouple.config("ADMIN_PASSWORD", default="admin123!", cast=str)
-    admin_username = decouple.config("ADMIN_USERNAME", default="admin", cast=str)
+    # Read admin credentials from settings (environment variables with sensible defaults)
+    admin_email = settings.ADMIN_EMAIL
+    admin_password = settings.ADMIN_PASSWORD
+    admin_username = settings.ADMIN_USERNAME
 
     # Query the database to check if an admin with this email or username already exists
     stmt = select(Account).where(
@@ -87,6 +87,8 @@ async def create_admin_user(async_session: AsyncSession) -> Account | None:
 async def seed_admin():
     """Main seeder function"""
     logger.info("Starting admin seeder...")
+    # Standalone runs skip application startup, so register every model here
+    resolve_all_models()
 
     try:
         # Open a database session and create the admin user
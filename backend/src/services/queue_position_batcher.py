@@ -0,0 +1,111 @@
+import asyncio
+from typing import Dict, List, Tuple
+
+from loguru import logger
+
+from src.repository.crud.queue import QueueCRUDRepository
+from src.repository.events import async_db_connection
+from src.services.queue_service import queue_service
+
+
+# Coalesces concurrent queue position lookups for the same event into one query.
+# At sale start thousands of WebSocket clients connect and refresh at once; instead of
+# one SELECT per client, requests arriving within BATCH_WINDOW_SECONDS of each other
+# share a single `user_id IN (...)` query and a single pooled connection.
+class QueuePositionBatcher:
+    """Batches queue position lookups per event"""
+
+    # How long the first request of a batch waits for others to join it
+    BATCH_WINDOW_SECONDS = 0.02
+    # Upper bound on users resolved by one query
+    MAX_BATCH_SIZE = 128
+
+    def __init__(self):
+        # event_id -> pending (user_id, future) requests waiting for the next flush
+        self._pending: Dict[int, List[Tuple[int, asyncio.Future]]] = {}
+        # event_id -> scheduled flush task; at most one per event
+        self._flush_tasks: Dict[int, asyncio.Task] = {}
+        # (event_id, user_id) -> unresolved lookup, shared by every concurrent caller for that user
+        self._inflight: Dict[Tuple[int, int], asyncio.Future] = {}
+
+    # Resolve one user's position, sharing the query with concurrent callers for the event.
+    # A lookup already in flight for the same user is joined rather than repeated.
+    # Returns None if the user is not in the queue.
+    async def get(self, event_id: int, user_id: int) -> dict | None:
+        """Get a user's queue position through the next batched query"""
+        key = (event_id, user_id)
+        future = self._inflight.get(key)
+
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self._pending.setdefault(event_id, []).append((user_id, future))
+
+            if event_id not in self._flush_tasks:
+                flush_task = asyncio.create_task(self._flush_after_window(event_id))
+                flush_task.add_done_callback(lambda task: self._on_flush_done(event_id, task))
+                self._flush_tasks[event_id] = flush_task
+
+        # Shielded so one caller going away (e.g. its WebSocket closing) cannot cancel the
+        # lookup for the others sharing it
+        return await asyncio.shield(future)
+
+    # Wait for the batch window to fill, then resolve everything queued for the event
+    async def _flush_after_window(self, event_id: int) -> None:
+        await asyncio.sleep(self.BATCH_WINDOW_SECONDS)
+
+        # Requests arriving from here on schedule a fresh flush
+        self._flush_tasks.pop(event_id, None)
+        batch = self._pending.pop(event_id, [])
+        try:
+            for start in range(0, len(batch), self.MAX_BATCH_SIZE):
+                await self._resolve(event_id, batch[start : start + self.MAX_BATCH_SIZE])
+        finally:
+            # Only reached with unresolved futures when the flush was cancelled (e.g. at shutdown)
+            self._fail(batch, RuntimeError(f"Position lookup for event {event_id} was cancelled"))
+
+    # Runs however the flush task ends. A task cancelled before it took its batch (possibly
+    # before its body ever started) is still registered, so its callers are failed here
+    def _on_flush_done(self, event_id: int, task: asyncio.Task) -> None:
+        if self._flush_tasks.get(event_id) is not task:
+            return
+        del self._flush_tasks[event_id]
+        self._fail(
+            self._pending.pop(event_id, []),
+            RuntimeError(f"Position lookup for event {event_id} was cancelled"),
+        )
+
+    # Run one bulk query and hand each waiting caller its row (or None)
+    async def _resolve(self, event_id: int, batch: List[Tuple[int, asyncio.Future]]) -> None:
+        user_ids = [user_id for user_id, _ in batch]
+
+        try:
+            # One prebuilt SELECT on a bare pooled connection; no ORM session is needed
+            async with async_db_connection() as connection:
+                result = await connection.execute(
+                    QueueCRUDRepository.position_snapshots_stmt(event_id=event_id, user_ids=user_ids)
+                )
+                snapshots = result.mappings().all()
+            positions = queue_service.positions_from_snapshots(event_id=event_id, snapshots=snapshots)
+        except Exception as e:
+            logger.error(f"Batched position lookup failed for event {event_id}: {e}")
+            self._fail(batch, e)
+            return
+
+        for user_id, future in batch:
+            if not future.done():
+                future.set_result(positions.get(user_id))
+
+    # Fail every still-unresolved future in the batch. The exception is marked as retrieved so
+    # futures whose callers have all gone away do not log "exception was never retrieved"
+    @staticmethod
+    def _fail(batch: List[Tuple[int, asyncio.Future]], error: BaseException) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+                future.exception()
+
+
+# Singleton instance — shared by every WebSocket connection in this worker
+queue_position_batcher = QueuePositionBatcher()
@@ -1,6 +1,6 @@
 import datetime
 from uuid import UUID
-from typing import Optional
+from typing import Mapping, Optional, Sequence
 
 from loguru import logger
 
@@ -90,44 +90,57 @@ class QueueService:
             "joined_at": entry.joined_at,
         }
 
+    # Turn a position snapshot row into the position payload shared by the REST and WebSocket APIs
+    def _build_position_data(self, event_id: int, snapshot: Mapping) -> dict:
+        estimated_wait = self.estimate_wait_time(
+            position=snapshot["position"],
+            batch_size=snapshot["queue_batch_size"],
+            processing_minutes=snapshot["queue_processing_minutes"],
+        )
+
+        # A processing entry can proceed until its checkout window passes
+        expires_at = snapshot["expires_at"]
+        is_expired = expires_at is not None and datetime.datetime.now(datetime.timezone.utc) > expires_at
+
+        # Return position info including whether the user can proceed to booking
+        return {
+            "queue_entry_id": snapshot["id"],
+            "event_id": event_id,
+            "position": snapshot["position"],
+            "status": snapshot["status"],
+            "estimated_wait_minutes": estimated_wait,
+            "total_ahead": snapshot["total_ahead"],
+            "expires_at": expires_at,
+            "can_proceed": snapshot["status"] == QueueStatus.PROCESSING.value and not is_expired,
+        }
+
     # Retrieve the current queue position and status for a specific user
     async def get_position(
         self,
         queue_repo: QueueCRUDRepository,
-        event_repo: EventCRUDRepository,
         event_id: int,
         user_id: int,
     ) -> dict | None:
         """Get user's current position in queue"""
-        # Look up the user's queue entry and count of users ahead
-        entry, ahead_count = await queue_repo.get_user_position(
+        # Entry, count of users ahead and event batch settings come back in one query
+        snapshot = await queue_repo.get_position_snapshot(
             event_id=event_id,
             user_id=user_id
         )
 
         # Return None if the user is not in the queue
-        if not entry:
+        if not snapshot:
             return None
 
-        # Fetch event details for batch size and processing time
-        event = await event_repo.read_event_by_id(event_id=event_id)
+        return self._build_position_data(event_id=event_id, snapshot=snapshot)
 
-        estimated_wait = self.estimate_wait_time(
-            position=entry.position,
-            batch_size=event.queue_batch_size,
-            processing_minutes=event.queue_processing_minutes,
-        )
-
-        # Return position info including whether the user can proceed to booking
+    # Build position payloads for several users of one event from position snapshot rows.
+    # Users without a row (not in the queue) are missing from the returned mapping.
+    def positions_from_snapshots(self, event_id: int, snapshots: Sequence[Mapping]) -> dict[int, dict]:
+        """Map position snapshot rows to per-user position payloads"""
         return {
-            "queue_entry_id": entry.id,
-            "event_id": event_id,
-            "position": entry.position,
-            "status": entry.status,
-            "estimated_wait_minutes": estimated_wait,
-            "total_ahead": ahead_count,
-            "expires_at": entry.expires_at,
-            "can_proceed": entry.status == QueueStatus.PROCESSING.value and not entry.is_expired,
+            snapshot["user_id"]: self._build_position_data(event_id=event_id, snapshot=snapshot)
+            for snapshot in snapshots
         }
 
     # Advance the queue by moving waiting users into the processing state
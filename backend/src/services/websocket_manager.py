@@ -1,7 +1,12 @@
 import asyncio
-from typing import Dict, Set
+import datetime
+import time
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
 
-from fastapi import WebSocket
+import msgpack
+import orjson
+from fastapi import WebSocket, WebSocketDisconnect
 from loguru import logger
 
 
@@ -9,102 +14,219 @@ from loguru import logger
 class QueueConnectionManager:
     """Manages WebSocket connections for queue updates"""
 
+    # Minimum spacing between client-initiated refreshes for one user on one event
+    REFRESH_MIN_INTERVAL_SECONDS = 1.0
+    # Upper bound on how long closing a replaced connection may take
+    STALE_CLOSE_TIMEOUT_SECONDS = 2.0
+    # Subprotocol a client offers to receive/send msgpack binary frames instead of JSON text
+    MSGPACK_SUBPROTOCOL = "msgpack"
+    # Sends issued concurrently per chunk of a fan-out; the loop yields between chunks
+    SEND_BATCH_SIZE = 50
+
     def __init__(self):
-        # Nested dict mapping event_id -> {user_id: websocket} for active connections
-        self.active_connections: Dict[int, Dict[int, WebSocket]] = {}
-        # Asyncio lock to ensure thread-safe access to the connections dict
-        self._lock = asyncio.Lock()
+        # Flat map (event_id, user_id) -> websocket: every lookup is a single hash
+        self.active_connections: Dict[Tuple[int, int], WebSocket] = {}
+        # Reverse index event_id -> connected user_ids, for per-event fan-out and listings
+        self._users_by_event: Dict[int, Set[int]] = {}
+        # One asyncio lock per event, so registering connections for one event never
+        # waits behind connects/disconnects on unrelated events
+        self._locks: Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Monotonic timestamp of the last accepted refresh per (event_id, user_id)
+        self._last_refresh: Dict[Tuple[int, int], float] = {}
+        # Last position_update message pushed per (event_id, user_id), with its JSON frame when
+        # the user's connection is a JSON one; the queue processor refreshes it whenever the
+        # queue changes, so client refreshes are served from it without re-encoding
+        self._last_position_update: Dict[Tuple[int, int], Tuple[dict, str | None]] = {}
+        # Connections that negotiated the msgpack subprotocol; all others get JSON text frames
+        self._msgpack_sockets: Set[WebSocket] = set()
+        # Strong references to in-flight background closes of replaced connections
+        self._closing_tasks: Set[asyncio.Task] = set()
+
+    # The lock guarding one event's connections. Callers that must mutate or read-modify-write
+    # an event's connection map take this lock rather than any manager-wide lock.
+    def lock_for(self, event_id: int) -> asyncio.Lock:
+        """Get the lock serialising connection changes for an event"""
+        return self._locks[event_id]
 
     # Accept a new WebSocket connection, closing any existing connection for the same user/event
     async def connect(self, websocket: WebSocket, event_id: int, user_id: int):
         """Accept and register a new WebSocket connection"""
         await websocket.accept()
+        await self.register(websocket, event_id, user_id)
 
-        async with self._lock:
-            # Create a new dict for this event if none exists yet
-            if event_id not in self.active_connections:
-                self.active_connections[event_id] = {}
-
-            # Close any previous connection for this user on the same event to avoid duplicates
-            if user_id in self.active_connections[event_id]:
-                try:
-                    await self.active_connections[event_id][user_id].close()
-                except Exception:
-                    pass
+    # Register an already-accepted WebSocket, closing any previous connection of the same
+    # user on the same event. Only this event's lock is held.
+    async def register(self, websocket: WebSocket, event_id: int, user_id: int):
+        """Register an accepted WebSocket connection"""
+        async with self.lock_for(event_id):
+            # Close any previous connection for this user on the same event to avoid duplicates.
+            # The close runs in the background: a half-closed peer must not stall the event lock.
+            previous_websocket = self.active_connections.get((event_id, user_id))
+            if previous_websocket is not None:
+                self.release_codec(previous_websocket)
+                task = asyncio.create_task(self._safe_close(previous_websocket))
+                self._closing_tasks.add(task)
+                task.add_done_callback(self._closing_tasks.discard)
 
             # Store the new WebSocket connection
-            self.active_connections[event_id][user_id] = websocket
+            self.active_connections[(event_id, user_id)] = websocket
+            self._users_by_event.setdefault(event_id, set()).add(user_id)
 
         logger.info(f"WebSocket connected: user {user_id} for event {event_id}")
 
-    # Remove and clean up a WebSocket connection for a specific user and event
-    async def disconnect(self, event_id: int, user_id: int):
-        """Remove a WebSocket connection"""
-        async with self._lock:
-            if event_id in self.active_connections:
-                if user_id in self.active_connections[event_id]:
-                    del self.active_connections[event_id][user_id]
+    # Close a replaced connection, bounded by STALE_CLOSE_TIMEOUT_SECONDS; errors are ignored
+    async def _safe_close(self, websocket: WebSocket):
+        try:
+            await asyncio.wait_for(websocket.close(), timeout=self.STALE_CLOSE_TIMEOUT_SECONDS)
+        except Exception:
+            pass
 
-                # Remove the event entry entirely if no users remain connected
-                if not self.active_connections[event_id]:
-                    del self.active_connections[event_id]
+    # Remove and clean up a WebSocket connection for a specific user and event.
+    # When `websocket` is given, nothing is removed unless it is still the registered
+    # connection, so a replaced connection shutting down cannot evict its successor.
+    async def disconnect(self, event_id: int, user_id: int, websocket: WebSocket | None = None):
+        """Remove a WebSocket connection"""
+        async with self.lock_for(event_id):
+            key = (event_id, user_id)
+            registered = self.active_connections.get(key)
+            if websocket is not None and registered is not websocket:
+                return
+            if registered is not None:
+                self._msgpack_sockets.discard(self.active_connections.pop(key))
+                event_users = self._users_by_event.get(event_id)
+                if event_users is not None:
+                    event_users.discard(user_id)
+                    # Remove the event entry entirely if no users remain connected
+                    if not event_users:
+                        del self._users_by_event[event_id]
+            self._last_refresh.pop(key, None)
+            self._last_position_update.pop(key, None)
 
         logger.info(f"WebSocket disconnected: user {user_id} for event {event_id}")
 
-    # Send a JSON message to a single user; disconnects the user if sending fails
-    async def send_to_user(self, event_id: int, user_id: int, message: dict):
+    # Rate-limit client "refresh" requests: returns True (and records the time) only if
+    # the previous accepted refresh is older than REFRESH_MIN_INTERVAL_SECONDS.
+    # Bursts collapse into one response; the position pushed moments ago is still current.
+    def allow_refresh(self, event_id: int, user_id: int) -> bool:
+        """Check whether a refresh may hit the database now"""
+        now = time.monotonic()
+        last = self._last_refresh.get((event_id, user_id))
+        if last is not None and now - last < self.REFRESH_MIN_INTERVAL_SECONDS:
+            return False
+        self._last_refresh[(event_id, user_id)] = now
+        return True
+
+    # Pick the wire format for a new connection: msgpack if the client offered the
+    # subprotocol, JSON text otherwise. Returns the subprotocol to accept with (or None).
+    def negotiate_codec(self, websocket: WebSocket) -> str | None:
+        """Choose msgpack or JSON framing for a connection"""
+        if self.MSGPACK_SUBPROTOCOL in websocket.scope.get("subprotocols", []):
+            self._msgpack_sockets.add(websocket)
+            return self.MSGPACK_SUBPROTOCOL
+        return None
+
+    # Forget the codec choice of a connection that is closed without being registered/kept
+    def release_codec(self, websocket: WebSocket) -> None:
+        self._msgpack_sockets.discard(websocket)
+
+    # Whether a connection exchanges msgpack binary frames
+    def uses_msgpack(self, websocket: WebSocket) -> bool:
+        return websocket in self._msgpack_sockets
+
+    # Read one client message in the connection's negotiated format
+    async def receive_message(self, websocket: WebSocket) -> dict:
+        """Receive and decode a client message"""
+        if websocket in self._msgpack_sockets:
+            return msgpack.unpackb(await websocket.receive_bytes())
+
+        # Parse the raw frame with orjson instead of receive_json's str + json.loads round-trip
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(code=message.get("code", 1000), reason=message.get("reason"))
+        return orjson.loads(message.get("text") or message.get("bytes"))
+
+    # Encode and send one message in the connection's negotiated format.
+    # `json_frame` lets broadcasts reuse a single JSON encoding across recipients.
+    async def send_message(self, websocket: WebSocket, message: dict, json_frame: str | None = None):
+        """Send a message to a websocket using its negotiated codec"""
+        if websocket in self._msgpack_sockets:
+            await websocket.send_bytes(msgpack.packb(message, datetime=True))
+        else:
+            # orjson encodes datetimes natively; frames stay text so clients keep JSON.parse-ing them
+            await websocket.send_text(json_frame or orjson.dumps(message).decode())
+
+    # Send a message to a single user; disconnects the user if sending fails.
+    # `json_frame` is a pre-encoded JSON text of `message`, reused for JSON connections.
+    async def send_to_user(self, event_id: int, user_id: int, message: dict, json_frame: str | None = None):
         """Send message to a specific user"""
-        websocket = None
-        # Retrieve the websocket reference under lock, then send outside the lock
-        async with self._lock:
-            if event_id in self.active_connections:
-                websocket = self.active_connections[event_id].get(user_id)
+        # A plain dict read with no await in between cannot interleave with a mutation
+        # on the event loop, so no lock is needed to look the websocket up
+        websocket = self.active_connections.get((event_id, user_id))
 
         if websocket:
             try:
-                await websocket.send_json(message)
+                await self.send_message(websocket, message, json_frame=json_frame)
             except Exception as e:
                 # On send failure, clean up the broken connection
                 logger.error(f"Failed to send to user {user_id}: {e}")
-                await self.disconnect(event_id, user_id)
+                await self.disconnect(event_id, user_id, websocket)
 
-    # Broadcast a JSON message to all connected users for a given event
+    # Fan (user_id, websocket, message, json_frame) sends out in chunks of SEND_BATCH_SIZE.
+    # Each chunk is sent concurrently and the loop yields between chunks, so a large event
+    # does not stall HTTP requests or new WebSocket accepts. Failed connections are dropped.
+    async def _send_in_batches(
+        self, event_id: int, sends: List[Tuple[int, WebSocket, dict, str | None]]
+    ):
+        disconnected = []
+        for start in range(0, len(sends), self.SEND_BATCH_SIZE):
+            chunk = sends[start:start + self.SEND_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(
+                    self.send_message(websocket, message, json_frame=json_frame)
+                    for _, websocket, message, json_frame in chunk
+                ),
+                return_exceptions=True,
+            )
+            for (user_id, websocket, _, _), result in zip(chunk, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to send to user {user_id}: {result}")
+                    disconnected.append((user_id, websocket))
+            await asyncio.sleep(0)
+
+        # Clean up all connections that failed during the fan-out
+        for user_id, websocket in disconnected:
+            await self.disconnect(event_id, user_id, websocket)
+
+    # Broadcast a message to all connected users for a given event
     async def broadcast_to_event(self, event_id: int, message: dict):
         """Broadcast message to all users in an event queue"""
-        # Snapshot the current connections under lock
-        users_to_notify = []
-        async with self._lock:
-            if event_id in self.active_connections:
-                users_to_notify = list(self.active_connections[event_id].items())
+        # Snapshot the current connections (atomic on the event loop, no lock needed)
+        users_to_notify = [
+            (user_id, self.active_connections[(event_id, user_id)])
+            for user_id in self._users_by_event.get(event_id, ())
+        ]
 
-        # Send to each user and track failures
-        disconnected = []
-        for user_id, websocket in users_to_notify:
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.error(f"Failed to broadcast to user {user_id}: {e}")
-                disconnected.append(user_id)
+        # Encode the JSON frame once for every text recipient
+        json_frame = orjson.dumps(message).decode()
 
-        # Clean up all connections that failed during broadcast
-        for user_id in disconnected:
-            await self.disconnect(event_id, user_id)
+        await self._send_in_batches(
+            event_id,
+            [(user_id, websocket, message, json_frame) for user_id, websocket in users_to_notify],
+        )
 
-    # Send a position update message containing queue position, status, and wait estimate
-    async def send_position_update(
-        self,
-        event_id: int,
-        user_id: int,
+    # Build the position_update message sent to the frontend
+    @staticmethod
+    def build_position_update(
         position: int,
         status: str,
         estimated_wait: int | None,
         total_ahead: int,
-        expires_at: str | None,
+        expires_at: datetime.datetime | None,
         can_proceed: bool
-    ):
-        """Send position update to a user"""
-        # Build a structured message with type and data payload for the frontend
-        message = {
+    ) -> dict:
+        """Build a position update message"""
+        # Structured message with type and data payload for the frontend
+        return {
             "type": "position_update",
             "data": {
                 "position": position,
@@ -115,7 +237,72 @@ class QueueConnectionManager:
                 "canProceed": can_proceed,
             }
         }
-        await self.send_to_user(event_id, user_id, message)
+
+    # Send a position update message containing queue position, status, and wait estimate
+    async def send_position_update(
+        self,
+        event_id: int,
+        user_id: int,
+        position: int,
+        status: str,
+        estimated_wait: int | None,
+        total_ahead: int,
+        expires_at: datetime.datetime | None,
+        can_proceed: bool
+    ):
+        """Send position update to a user"""
+        message = self.build_position_update(
+            position=position,
+            status=status,
+            estimated_wait=estimated_wait,
+            total_ahead=total_ahead,
+            expires_at=expires_at,
+            can_proceed=can_proceed,
+        )
+        websocket = self.active_connections.get((event_id, user_id))
+        json_frame = self._remember_position(event_id, user_id, message, websocket)
+        await self.send_to_user(event_id, user_id, message, json_frame=json_frame)
+
+    # Send prebuilt position updates ({user_id: message}) to many users of an event in
+    # batches, recording each as the user's latest snapshot. Users not connected are skipped.
+    async def send_position_updates(self, event_id: int, messages: Dict[int, dict]):
+        """Send position updates to several users"""
+        sends = []
+        for user_id, message in messages.items():
+            websocket = self.active_connections.get((event_id, user_id))
+            if websocket is None:
+                continue
+            json_frame = self._remember_position(event_id, user_id, message, websocket)
+            sends.append((user_id, websocket, message, json_frame))
+
+        await self._send_in_batches(event_id, sends)
+
+    # Record a position update as the user's latest snapshot. It is encoded to JSON once here
+    # when the connection takes JSON frames, and that frame serves the push and every resend.
+    def _remember_position(
+        self, event_id: int, user_id: int, message: dict, websocket: WebSocket | None
+    ) -> str | None:
+        json_frame = None
+        if websocket is not None and not self.uses_msgpack(websocket):
+            json_frame = orjson.dumps(message).decode()
+        self._last_position_update[(event_id, user_id)] = (message, json_frame)
+        return json_frame
+
+    # Re-send the last pushed position to a user without querying the database.
+    # Returns False when no snapshot is held, so the caller falls back to a fresh fetch.
+    async def resend_last_position(self, event_id: int, user_id: int) -> bool:
+        """Re-send the most recent position update to a user"""
+        snapshot = self._last_position_update.get((event_id, user_id))
+        if snapshot is None:
+            return False
+        message, json_frame = snapshot
+        await self.send_to_user(event_id, user_id, message, json_frame=json_frame)
+        return True
+
+    # Drop a user's position snapshot (e.g. after they left the queue or their slot expired)
+    def clear_last_position(self, event_id: int, user_id: int) -> None:
+        """Forget the cached position update for a user"""
+        self._last_position_update.pop((event_id, user_id), None)
 
     # Notify a user when their queue status changes (e.g., waiting -> processing)
     async def send_status_change(
@@ -148,14 +335,12 @@ class QueueConnectionManager:
     # Return the set of user IDs currently connected via WebSocket for a specific event
     def get_connected_users(self, event_id: int) -> Set[int]:
         """Get set of connected user IDs for an event"""
-        if event_id in self.active_connections:
-            return set(self.active_connections[event_id].keys())
-        return set()
+        return set(self._users_by_event.get(event_id, ()))
 
     # Return all event IDs that have at least one active WebSocket connection
     def get_active_event_ids(self) -> Set[int]:
         """Get all event IDs with active connections"""
-        return set(self.active_connections.keys())
+        return set(self._users_by_event.keys())
 
 
 # Singleton instance — shared across the application for WebSocket connection management
@@ -0,0 +1,61 @@
+import asyncio
+
+from loguru import logger
+
+from src.repository.crud.otp import OTPCRUDRepository
+from src.repository.events import async_db_session
+
+
+# Background worker that periodically deletes expired OTP codes so the table (and its
+# partial lookup indexes) only ever holds codes that can still be verified
+class OTPCleanupWorker:
+    """Background worker to purge expired OTP codes."""
+
+    # Initialize with a configurable cleanup interval (default 1 hour)
+    def __init__(self, interval_seconds: int = 3600):
+        self.interval_seconds = interval_seconds
+        # Reference to the running asyncio task
+        self._task: asyncio.Task | None = None
+        # Flag to control the cleanup loop
+        self._running = False
+
+    # Start the background cleanup loop as an asyncio task
+    async def start(self):
+        """Start the OTP cleanup worker."""
+        # Prevent starting multiple instances
+        if self._running:
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+        logger.info("OTP cleanup worker started")
+
+    # Gracefully stop the background cleanup loop and cancel the task
+    async def stop(self):
+        """Stop the OTP cleanup worker."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("OTP cleanup worker stopped")
+
+    # Main loop: waits one interval, then deletes every expired code in a single statement
+    async def _run(self):
+        """Main cleanup loop."""
+        while self._running:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                async with async_db_session() as session:
+                    deleted = await OTPCRUDRepository(async_session=session).cleanup_expired_otps()
+                if deleted:
+                    logger.info(f"Deleted {deleted} expired OTP codes")
+            except Exception as e:
+                # Log errors but keep the loop running
+                logger.error(f"Error in OTP cleanup worker: {e}")
+
+
+# Singleton instance — started during application boot and runs in the background
+otp_cleanup_worker = OTPCleanupWorker()
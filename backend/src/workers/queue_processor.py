@@ -1,4 +1,6 @@
 import asyncio
+import time
+
 from loguru import logger
 
 from src.repository.crud.queue import QueueCRUDRepository
@@ -19,6 +21,9 @@ class QueueProcessor:
         self._task: asyncio.Task | None = None
         # Flag to control the processing loop
         self._running = False
+        # Events whose queue changed since the last cycle, and the signal that wakes the loop early
+        self._changed_event_ids: set[int] = set()
+        self._wakeup = asyncio.Event()
 
     # Start the background queue processing loop as an asyncio task
     async def start(self):
@@ -43,24 +48,51 @@ class QueueProcessor:
                 pass
         logger.info("Queue processor stopped")
 
-    # Main loop that repeatedly processes all queues at the configured interval
+    # Signal that an event's queue was mutated (join/leave) so connected users get
+    # fresh positions right away. One recompute serves every viewer of the event,
+    # instead of each client polling the database with "refresh" messages.
+    # The signal is in-process only: with several server workers, it wakes the processor of
+    # the worker that handled the join/leave. Viewers connected to other workers get the
+    # change on their worker's next periodic sweep (at most `interval_seconds` later).
+    def notify_queue_changed(self, event_id: int) -> None:
+        """Schedule an immediate position push for an event."""
+        self._changed_event_ids.add(event_id)
+        self._wakeup.set()
+
+    # Main loop: sweeps all queues at the configured interval, and in between
+    # pushes updates for events flagged through notify_queue_changed
     async def _run(self):
         """Main processing loop."""
+        next_sweep_at = time.monotonic()
         while self._running:
+            # Sleep until the next sweep or until a queue mutation wakes us up
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    timeout=max(0.0, next_sweep_at - time.monotonic()),
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            changed_event_ids, self._changed_event_ids = self._changed_event_ids, set()
+
             try:
-                await self._process_all_queues()
+                if time.monotonic() >= next_sweep_at:
+                    await self._process_all_queues()
+                    next_sweep_at = time.monotonic() + self.interval_seconds
+                elif changed_event_ids:
+                    await self._process_all_queues(event_ids=changed_event_ids)
             except Exception as e:
                 # Log errors but keep the loop running
                 logger.error(f"Error in queue processor: {e}")
 
-            # Wait for the configured interval before the next processing cycle
-            await asyncio.sleep(self.interval_seconds)
-
     # Iterate over all events with active WebSocket connections and process their queues
-    async def _process_all_queues(self):
-        """Process all active event queues."""
+    async def _process_all_queues(self, event_ids: set[int] | None = None):
+        """Process all active event queues, or only `event_ids` when given."""
         # Only process events that have users actively connected via WebSocket
         active_event_ids = queue_connection_manager.get_active_event_ids()
+        if event_ids is not None:
+            active_event_ids &= event_ids
 
         # Skip if no events have active connections
         if not active_event_ids:
@@ -107,7 +139,8 @@ class QueueProcessor:
         # Get the set of users currently connected via WebSocket for this event
         connected_users = queue_connection_manager.get_connected_users(event_id)
 
-        # Send position updates only to users who are connected via WebSocket
+        # Build position updates only for users who are connected via WebSocket
+        position_updates = {}
         for entry in entries:
             if entry.user_id in connected_users:
                 # Count how many active entries are ahead of this user in the queue
@@ -124,29 +157,28 @@ class QueueProcessor:
                     processing_minutes=event.queue_processing_minutes,
                 )
 
-                # Format the expiry timestamp as an ISO string if present
-                expires_at_str = None
-                if entry.expires_at:
-                    expires_at_str = entry.expires_at.isoformat()
-
                 # Determine if the user can proceed to booking (processing and not expired)
                 can_proceed = entry.status == "processing" and not entry.is_expired
 
-                # Send the real-time position update via WebSocket
-                await queue_connection_manager.send_position_update(
-                    event_id=event_id,
-                    user_id=entry.user_id,
+                position_updates[entry.user_id] = queue_connection_manager.build_position_update(
                     position=entry.position,
                     status=entry.status,
                     estimated_wait=estimated_wait,
                     total_ahead=ahead_count,
-                    expires_at=expires_at_str,
+                    expires_at=entry.expires_at,
                     can_proceed=can_proceed,
                 )
 
+        # Send the real-time position updates via WebSocket in yielding batches
+        await queue_connection_manager.send_position_updates(event_id, position_updates)
+
+        # Connected users no longer in the queue must not be served a stale snapshot on refresh
+        queued_user_ids = {entry.user_id for entry in entries}
+        for user_id in connected_users - queued_user_ids:
+            queue_connection_manager.clear_last_position(event_id, user_id)
+
         # Send heartbeat to all connected users to keep WebSocket connections alive
-        for user_id in connected_users:
-            await queue_connection_manager.send_heartbeat(event_id, user_id)
+        await queue_connection_manager.broadcast_to_event(event_id, {"type": "heartbeat", "data": {}})
 
 
 # Singleton instance — started during application boot and runs in the background
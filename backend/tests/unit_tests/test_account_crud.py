@@ -0,0 +1,55 @@
+import pytest
+import sqlalchemy
+
+from src.models.schemas.account import AccountProfileUpdate
+from src.repository.crud.account import AccountCRUDRepository
+from src.utilities.exceptions.database import EntityAlreadyExists, EntityDoesNotExist
+
+
+class _EmptyResult:
+    def scalar(self) -> None:
+        return None
+
+
+# Session whose UPDATE matches no row; probe answers are taken in order from `probe_results`
+class _FakeSession:
+    def __init__(self, probe_results: list[bool]):
+        self.probe_results = probe_results
+        self.probes: list[sqlalchemy.Select] = []
+
+    async def execute(self, statement: sqlalchemy.Update) -> _EmptyResult:
+        return _EmptyResult()
+
+    async def commit(self) -> None:
+        pass
+
+    async def scalar(self, statement: sqlalchemy.Select) -> bool:
+        self.probes.append(statement)
+        return self.probe_results.pop(0)
+
+
+async def test_conflict_probe_reports_the_taken_email() -> None:
+    session = _FakeSession(probe_results=[False, True])
+    repository = AccountCRUDRepository(async_session=session)
+
+    with pytest.raises(EntityAlreadyExists, match="Email is already registered"):
+        await repository.update_profile_checked(
+            account_id=42,
+            profile_update=AccountProfileUpdate(username="taken", email="taken@example.com"),
+        )
+
+    # Both probes must ignore the caller's own row, exactly like the UPDATE guards
+    for probe in session.probes:
+        compiled = probe.compile(compile_kwargs={"literal_binds": True})
+        assert "!= 42" in str(compiled)
+
+
+async def test_conflict_probe_reports_a_missing_account() -> None:
+    session = _FakeSession(probe_results=[False, False])
+    repository = AccountCRUDRepository(async_session=session)
+
+    with pytest.raises(EntityDoesNotExist):
+        await repository.update_profile_checked(
+            account_id=42,
+            profile_update=AccountProfileUpdate(username="free"),
+        )
@@ -0,0 +1,23 @@
+import collections
+
+import src.models.db
+from src.models.db.booking import BookingItem
+from src.repository.table import Base
+
+
+def test_each_table_is_mapped_by_exactly_one_model() -> None:
+    src.models.db.resolve_all()
+
+    mapped_tables = collections.Counter(mapper.local_table.name for mapper in Base.registry.mappers)
+
+    assert mapped_tables["account"] == 1
+    assert mapped_tables["admin_activity_log"] == 1
+    assert all(count == 1 for count in mapped_tables.values())
+
+
+def test_ticket_numbers_are_generated_in_bulk() -> None:
+    ticket_numbers = BookingItem.generate_ticket_numbers(5)
+
+    assert len(ticket_numbers) == 5
+    assert all(len(number) == 16 and number.startswith("TKT-") for number in ticket_numbers)
+    assert BookingItem.generate_ticket_numbers(0) == []
@@ -0,0 +1,19 @@
+from src.securities.hashing.otp import OTPHasher
+
+
+def test_hash_code_is_deterministic() -> None:
+    hasher = OTPHasher()
+
+    digest = hasher.hash_code("123456")
+
+    assert digest == hasher.hash_code("123456")
+    assert len(digest) == 32
+    assert digest != hasher.hash_code("654321")
+
+
+def test_hash_code_depends_on_key() -> None:
+    hasher = OTPHasher()
+    other_hasher = OTPHasher()
+    other_hasher._key = b"another-hashing-salt"
+
+    assert hasher.hash_code("123456") != other_hasher.hash_code("123456")
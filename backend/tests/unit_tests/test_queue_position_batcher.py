@@ -0,0 +1,131 @@
+import asyncio
+import contextlib
+
+import pytest
+
+import src.services.queue_position_batcher as batcher_module
+from src.repository.crud.queue import QueueCRUDRepository
+from src.services.queue_position_batcher import QueuePositionBatcher
+
+
+def _snapshot(user_id: int, position: int) -> dict:
+    return {
+        "id": f"entry-{user_id}",
+        "user_id": user_id,
+        "position": position,
+        "status": "waiting",
+        "expires_at": None,
+        "total_ahead": position - 1,
+        "queue_batch_size": 50,
+        "queue_processing_minutes": 10,
+    }
+
+
+class _FakeResult:
+    def __init__(self, rows: list[dict]):
+        self._rows = rows
+
+    def mappings(self) -> "_FakeResult":
+        return self
+
+    def all(self) -> list[dict]:
+        return self._rows
+
+
+# Stands in for the pooled connection: records the user IDs of every query it runs
+class _FakeConnection:
+    def __init__(self, rows: dict[int, dict], error: Exception | None = None):
+        self.rows = rows
+        self.error = error
+        self.queries: list[list[int]] = []
+
+    async def execute(self, stmt: tuple[int, list[int]]) -> _FakeResult:
+        _, user_ids = stmt
+        self.queries.append(user_ids)
+        if self.error is not None:
+            raise self.error
+        return _FakeResult([self.rows[user_id] for user_id in user_ids if user_id in self.rows])
+
+
+@pytest.fixture(name="connection")
+def connection(monkeypatch: pytest.MonkeyPatch) -> _FakeConnection:
+    fake_connection = _FakeConnection(rows={user_id: _snapshot(user_id, user_id) for user_id in range(1, 6)})
+
+    @contextlib.asynccontextmanager
+    async def fake_async_db_connection():
+        yield fake_connection
+
+    monkeypatch.setattr(batcher_module, "async_db_connection", fake_async_db_connection)
+    # The statement is passed through as (event_id, user_ids) so the fake can read the batch
+    monkeypatch.setattr(
+        QueueCRUDRepository,
+        "position_snapshots_stmt",
+        staticmethod(lambda event_id, user_ids: (event_id, list(user_ids))),
+    )
+    return fake_connection
+
+
+async def test_concurrent_lookups_share_one_query(connection: _FakeConnection) -> None:
+    batcher = QueuePositionBatcher()
+
+    first, second, missing = await asyncio.gather(
+        batcher.get(event_id=1, user_id=1),
+        batcher.get(event_id=1, user_id=2),
+        batcher.get(event_id=1, user_id=99),
+    )
+
+    assert connection.queries == [[1, 2, 99]]
+    assert first["position"] == 1 and second["position"] == 2
+    assert missing is None
+
+
+async def test_large_batches_are_split(connection: _FakeConnection) -> None:
+    batcher = QueuePositionBatcher()
+    batcher.MAX_BATCH_SIZE = 2
+
+    results = await asyncio.gather(*(batcher.get(event_id=1, user_id=user_id) for user_id in range(1, 6)))
+
+    assert connection.queries == [[1, 2], [3, 4], [5]]
+    assert [result["position"] for result in results] == [1, 2, 3, 4, 5]
+
+
+async def test_lookup_in_flight_for_a_user_is_joined(connection: _FakeConnection) -> None:
+    batcher = QueuePositionBatcher()
+
+    first, second = await asyncio.gather(batcher.get(event_id=1, user_id=3), batcher.get(event_id=1, user_id=3))
+
+    assert connection.queries == [[3]]
+    assert first == second
+    assert not batcher._inflight
+
+
+async def test_failed_query_reaches_every_caller(connection: _FakeConnection) -> None:
+    batcher = QueuePositionBatcher()
+    connection.error = RuntimeError("database unavailable")
+
+    results = await asyncio.gather(
+        batcher.get(event_id=1, user_id=1),
+        batcher.get(event_id=1, user_id=2),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert not batcher._inflight
+
+    # A later lookup runs a fresh query instead of waiting on the failed one
+    connection.error = None
+    assert (await batcher.get(event_id=1, user_id=1))["position"] == 1
+
+
+async def test_cancelled_flush_fails_waiting_callers(connection: _FakeConnection) -> None:
+    batcher = QueuePositionBatcher()
+
+    lookup = asyncio.create_task(batcher.get(event_id=1, user_id=1))
+    await asyncio.sleep(0)
+    batcher._flush_tasks[1].cancel()
+
+    # Bounded so a regression fails instead of hanging the whole run
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(lookup, timeout=1)
+    assert not batcher._inflight and not batcher._pending and not batcher._flush_tasks
+    assert connection.queries == []
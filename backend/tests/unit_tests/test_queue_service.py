@@ -0,0 +1,40 @@
+import datetime
+
+from src.services.queue_service import queue_service
+
+
+def _snapshot(user_id: int, position: int, status: str, expires_at: datetime.datetime | None = None) -> dict:
+    return {
+        "id": f"entry-{user_id}",
+        "user_id": user_id,
+        "position": position,
+        "status": status,
+        "expires_at": expires_at,
+        "total_ahead": position - 1,
+        "queue_batch_size": 10,
+        "queue_processing_minutes": 5,
+    }
+
+
+def test_positions_from_snapshots_maps_each_user() -> None:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    snapshots = [
+        _snapshot(user_id=1, position=1, status="processing", expires_at=now + datetime.timedelta(minutes=5)),
+        _snapshot(user_id=2, position=2, status="processing", expires_at=now - datetime.timedelta(minutes=1)),
+        _snapshot(user_id=3, position=25, status="waiting"),
+    ]
+
+    positions = queue_service.positions_from_snapshots(event_id=7, snapshots=snapshots)
+
+    assert set(positions) == {1, 2, 3}
+    assert positions[1]["can_proceed"] is True
+    assert positions[2]["can_proceed"] is False
+    assert positions[3]["can_proceed"] is False
+    assert positions[3]["event_id"] == 7
+    assert positions[3]["total_ahead"] == 24
+    # Two full batches of 10 ahead, each costing min(AVG_CHECKOUT_TIME_MINUTES, 5) minutes
+    assert positions[3]["estimated_wait_minutes"] == 2 * queue_service.AVG_CHECKOUT_TIME_MINUTES
+
+
+def test_positions_from_snapshots_without_rows_is_empty() -> None:
+    assert queue_service.positions_from_snapshots(event_id=7, snapshots=[]) == {}
@@ -0,0 +1,28 @@
+import time
+
+from src.securities.authorizations.token_cache import JWTUserCache
+
+
+def test_cached_token_resolves_until_invalidated() -> None:
+    cache = JWTUserCache()
+    cache.set(token="token-a", user_id=7, is_blocked=False, exp=time.time() + 60)
+
+    assert cache.get(token="token-a") == (7, False)
+    assert cache.get(token="token-b") is None
+
+    cache.invalidate_user(user_id=7)
+    assert cache.get(token="token-a") is None
+
+
+def test_expired_token_is_not_cached() -> None:
+    cache = JWTUserCache()
+    cache.set(token="token-a", user_id=7, is_blocked=False, exp=time.time() - 1)
+
+    assert cache.get(token="token-a") is None
+
+
+def test_entry_lifetime_is_capped_by_max_ttl() -> None:
+    cache = JWTUserCache(max_ttl_seconds=0)
+    cache.set(token="token-a", user_id=7, is_blocked=False, exp=time.time() + 60)
+
+    assert cache.get(token="token-a") is None